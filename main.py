@@ -1,17 +1,33 @@
+import argparse
 import logging
 import re
-import time
 from collections import defaultdict
-
-from src.adapters.article_parser import fetch_article, classify_article
+from datetime import timedelta
+
+from src.adapters.article_parser import (
+    ArticleFetchMemo,
+    DownloadLimits,
+    FetchStats,
+    HeadProbe,
+    fetch_articles,
+    classify_article,
+)
 from src.adapters.email_notifier import send_mail
+from src.adapters.http_cache import HttpPageCache
+from src.adapters.http_session import connection_stats
+from src.adapters.host_scheduler import HostScheduler
 from src.adapters.google_alert_source import (
+    FeedStateStore,
     fetch_google_alert_articles,
     dedup_alert_articles,
+    poll_feeds,
 )
 
 from src.adapters.openai_summarizer import summarize_with_gpt, generate_morning_summary
-from src.adapters.serper_source import search_serper
+from src.adapters.seen_store import SeenArticleStore
+from src.adapters.serper_cache import SerperResultCache
+from src.adapters.serper_source import SerperPaging, search_serper_batch
+from src.adapters.story_index import RecentStoryIndex
 from src.adapters.yahoo_finance import fetch_fx_rates, generate_stock_section
 from src.adapters.notion_client import NotionClient
 from src.adapters.notion_exporter import NotionExporter
@@ -23,6 +39,7 @@ from src.config.notion import load_notion_config
 from src.config.prompts import load_prompts
 from src.config.settings import load_settings
 from src.domain.article_dedup import deduplicate_articles
+from src.domain.notion_utils import compute_article_id, compute_body_hash
 from src.domain.time_utils import (
     now_utc,
     format_dt_jst,
@@ -32,16 +49,18 @@ from src.domain.time_utils import (
     JST,
     compute_lookback_window,
     is_within_window,
+    is_clearly_outside_window,
 )
+from src.usecases.pipeline import run_pipeline
 from src.usecases.score_articles import apply_scores
 from src.usecases.summary_select import (
     select_summary_articles,
     importance_value,
-    extract_hard_exclusion_rules,
     apply_hard_exclusion,
+    count_summary_candidates,
     sort_for_summary,
 )
-from src.domain.rule_engine import build_rules
+from src.domain.rule_engine import compile_rules
 from src.usecases.tag_articles import apply_tags, load_tag_rules
 from src.usecases.target_coverage import build_processing_labels, summarize_target_coverage
 
@@ -74,7 +93,18 @@ def apply_diversity_limits_for_global_summary(articles, targets_by_label, top_n)
     return picked
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Daily steel industry news digest")
+    parser.add_argument(
+        "--refresh-search",
+        action="store_true",
+        help="Ignore cached Serper results and search again (fresh results are still cached).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     logging.basicConfig(level=logging.INFO)
     settings = load_settings()
     notion_config = load_notion_config()
@@ -100,7 +130,12 @@ def main():
     target_entries = fetch_targets_from_notion(notion_client, env.NOTION_TARGETS_DB_ID)
     targets, _, google_alert_rss, targets_by_label = build_targets_map(target_entries)
     labels = build_processing_labels(targets, google_alert_rss)
-    target_stats = summarize_target_coverage(labels, targets, google_alert_rss)
+    feed_polls = poll_feeds(
+        [rss_url for label in labels for rss_url in google_alert_rss.get(label, [])],
+        state=FeedStateStore.from_settings(settings),
+        max_workers=settings.get("limits", {}).get("rss_poll_concurrency", 8),
+    )
+    target_stats = summarize_target_coverage(labels, targets, google_alert_rss, feed_polls=feed_polls)
     logging.info(
         "Targets loaded: labels=%d serper_queries=%d rss_feeds=%d rss_only=%d serper_only=%d",
         target_stats["labels"],
@@ -109,12 +144,23 @@ def main():
         target_stats["rss_only"],
         target_stats["serper_only"],
     )
+    logging.info(
+        "RSS polling: polled=%d not_modified=%d not_modified_rate=%.1f%% errors=%d avg_latency=%.2fs max_latency=%.2fs",
+        target_stats["rss_polled"],
+        target_stats["rss_not_modified"],
+        100.0 * target_stats["rss_not_modified_rate"],
+        target_stats["rss_poll_errors"],
+        target_stats["rss_poll_avg_seconds"],
+        target_stats["rss_poll_max_seconds"],
+    )
 
     reference_time = now_utc()
     today_str = reference_time.strftime("%Y%m%d")
     run_id = reference_time.strftime("%Y%m%dT%H%M%SZ")
     hours = settings.get("limits", {}).get("hours", 24)
     max_articles = settings.get("limits", {}).get("max_articles_per_label", 5)
+    fetch_concurrency = settings.get("limits", {}).get("fetch_concurrency", 8)
+    prefetch_tolerance = timedelta(hours=settings.get("limits", {}).get("prefetch_window_tolerance_hours", 12))
     openai_settings = settings.get("openai", {})
     label_openai_settings = openai_settings.get("label_summary", {})
     morning_openai_settings = openai_settings.get("morning_summary", {})
@@ -152,14 +198,30 @@ def main():
     logging.info("Notion exporter configured for articles and daily summary")
 
     fetch_fx_rates()
-    engine_rules = build_rules(notion_rules)
-    hard_exclusion_rules = extract_hard_exclusion_rules(engine_rules)
+    engine_rules = compile_rules(notion_rules)
     notice_html = """
     <div style="font-family:'Meiryo UI','Meiryo',sans-serif; font-size:12px; color:#666; margin-bottom:16px;">
     ※本メールはAIにより自動生成しています。内容の正確性については、必ず原文記事等により別途ご確認ください。
     </div>
     """
 
+    serper_cache = SerperResultCache.from_settings(settings, refresh=args.refresh_search)
+    fetch_memo = ArticleFetchMemo()
+    page_cache = HttpPageCache.from_settings(settings)
+    seen_store = SeenArticleStore.from_settings(settings)
+    run_day = run_time_jst.date()
+    story_index = RecentStoryIndex.from_settings(settings, run_day)
+    if story_index is not None:
+        logging.info("Story index: loaded=%d", len(story_index))
+    host_scheduler = HostScheduler.from_settings(settings)
+    fetch_stats = FetchStats()
+    fetch_options = {
+        "cache": page_cache,
+        "scheduler": host_scheduler,
+        "limits": DownloadLimits.from_settings(settings),
+        "stats": fetch_stats,
+        "probe": HeadProbe.from_settings(settings, window_start_jst, window_end_jst),
+    }
     sections = []
     all_scored_articles = []
     no_article_labels = []
@@ -167,7 +229,27 @@ def main():
     total_articles = 0
     notion_failures = 0
 
-    for label in labels:
+    # One batched search for every label's queries; results fan out per label below.
+    run_queries = [q for label in labels for q in targets.get(label, [])]
+    serper_paging = SerperPaging.from_settings(settings)
+    search_results = search_serper_batch(
+        run_queries,
+        cache=serper_cache,
+        window_start=window_start_jst,
+        num=serper_paging.num,
+    )
+    logging.info("Serper batch: queries=%d unique=%d", len(run_queries), len(search_results))
+    if serper_cache is not None:
+        logging.info(
+            "Serper cache: hits=%d misses=%d stored=%d expired=%d refresh=%s",
+            serper_cache.stats["hits"],
+            serper_cache.stats["misses"],
+            serper_cache.stats["stored"],
+            serper_cache.stats["expired"],
+            serper_cache.refresh,
+        )
+
+    def collect_label(label):
         queries = targets.get(label, [])
         articles = []
 
@@ -177,26 +259,76 @@ def main():
             "url_date_used": 0,
             "missing_published_at": 0,
             "outside_window": 0,
+            "skipped_prefetch": 0,
+            "skipped_probe": 0,
+            "seen_previously": 0,
+            "skipped_seen": 0,
             "missing_samples": [],
             "outside_window_samples": [],
             "serper_date_samples": [],
         }
 
+        # Queries are consumed in order until the first credit error, as before.
+        active_queries = []
         for q in queries:
-            search_result = search_serper(q)
-            if search_result == "SERPER_CREDIT_ERROR":
+            if search_results[q] == "SERPER_CREDIT_ERROR":
                 break
-
-            for a in search_result:
+            active_queries.append(q)
+        page_results = [search_results[q] for q in active_queries]
+        serper_depth = {"pages": 0, "results": 0, "candidates": 0}
+
+        while True:
+            serper_depth["pages"] += 1
+            candidates = []
+            for search_result in page_results:
+                serper_depth["results"] += len(search_result)
+                for a in search_result:
+                    # Serper/URL dates are only hints, so skip the download just when
+                    # they put the article outside the window beyond the tolerance.
+                    serper_dt = parse_publish_datetime(a.get("date"), reference_time)
+                    url_dt = parse_publish_datetime_from_url(a.get("link", ""), reference_time)
+                    if serper_dt:
+                        skip = is_clearly_outside_window(serper_dt, window_start_jst, window_end_jst, prefetch_tolerance)
+                    else:
+                        # URL dates carry no time of day, so allow one more day.
+                        skip = is_clearly_outside_window(
+                            url_dt,
+                            window_start_jst - timedelta(days=1),
+                            window_end_jst,
+                            prefetch_tolerance,
+                        )
+                    if skip:
+                        date_stats["skipped_prefetch"] += 1
+                        continue
+                    seen = seen_store.lookup(compute_article_id(a.get("link", ""))) if seen_store is not None else None
+                    if seen is not None and seen.first_seen < run_day.isoformat():
+                        date_stats["seen_previously"] += 1
+                        # An earlier run already settled this page's date outside today's window.
+                        if seen.published_at and not is_within_window(seen.published_at, window_start_jst, window_end_jst):
+                            date_stats["skipped_seen"] += 1
+                            continue
+                    candidates.append((a, serper_dt, url_dt))
+
+            fetched = fetch_articles(
+                [a.get("link", "") for a, _, _ in candidates],
+                reference_time,
+                max_workers=fetch_concurrency,
+                memo=fetch_memo,
+                **fetch_options,
+            )
+            for (a, serper_dt, url_dt), (body, scraped_dt, body_excerpt, fetched_published_source) in zip(candidates, fetched):
                 url = a.get("link", "")
                 serper_raw = a.get("date")
-                serper_dt = parse_publish_datetime(serper_raw, reference_time)
-                body, scraped_dt, body_excerpt, fetched_published_source = fetch_article(url, reference_time)
+                article_id = compute_article_id(url) if seen_store is not None else ""
                 if not body:
+                    if scraped_dt:
+                        # The head probe dated it outside the window before the body was read.
+                        date_stats["skipped_probe"] += 1
+                        if article_id:
+                            seen_store.remember(article_id, run_day, ensure_aware_utc(scraped_dt))
                     continue
 
                 scraped_dt = ensure_aware_utc(scraped_dt)
-                url_dt = parse_publish_datetime_from_url(url, reference_time)
 
                 if scraped_dt:
                     final_dt = scraped_dt
@@ -216,6 +348,9 @@ def main():
                     final_dt = None
                     published_source = "missing"
 
+                if article_id:
+                    seen_store.remember(article_id, run_day, final_dt, compute_body_hash(body))
+
                 if not final_dt:
                     date_stats["missing_published_at"] += 1
                     if len(date_stats["missing_samples"]) < 5:
@@ -230,7 +365,7 @@ def main():
                     )
                     continue
 
-                articles.append({
+                article = {
                     "title": a.get("title", ""),
                     "body": body_excerpt,
                     "body_full": body,
@@ -241,18 +376,50 @@ def main():
                     "final_dt": final_dt,
                     "published_at": final_dt.isoformat(),
                     "published_source": published_source or "unknown",
-                    "type": classify_article({
-                        "title": a.get("title", ""),
-                        "body": body
-                    }),
                     "target_label": label,
-                })
+                }
+                # Classified on the article itself so its lower-cased text view is reused by scoring/tagging.
+                article["type"] = classify_article(article)
+                articles.append(article)
+
+            serper_depth["candidates"] += len(candidates)
+            if serper_depth["pages"] >= serper_paging.max_pages:
+                break
+            full_queries = [q for q, result in zip(active_queries, page_results) if len(result) >= serper_paging.num]
+            if not full_queries:
+                break
+            if count_summary_candidates(articles, window_start_jst, window_end_jst, engine_rules) >= serper_paging.target:
+                break
+            next_results = search_serper_batch(
+                full_queries,
+                num=serper_paging.num,
+                page=serper_depth["pages"] + 1,
+                cache=serper_cache,
+                window_start=window_start_jst,
+            )
+            active_queries = []
+            for q in full_queries:
+                if next_results[q] == "SERPER_CREDIT_ERROR":
+                    break
+                active_queries.append(q)
+            if not active_queries:
+                break
+            page_results = [next_results[q] for q in active_queries]
+
+        logging.info(
+            "Serper depth label=%s pages=%d results=%d candidates=%d",
+            label,
+            serper_depth["pages"],
+            serper_depth["results"],
+            serper_depth["candidates"],
+        )
 
         articles.sort(key=lambda x: x["final_dt"], reverse=True)
 
         rss_feeds = google_alert_rss.get(label, [])
         if rss_feeds and len(articles) < max_articles:
             need = max_articles - len(articles)
+            alert_stats = {}
 
             alert_articles = fetch_google_alert_articles(
                 label,
@@ -261,6 +428,22 @@ def main():
                 hours=hours,
                 window_start=window_start_jst,
                 window_end=window_end_jst,
+                fetch_memo=fetch_memo,
+                fetch_options=fetch_options,
+                feed_polls=feed_polls,
+                serper_articles=articles,
+                need=need,
+                tolerance=prefetch_tolerance,
+                stats=alert_stats,
+            )
+            logging.info(
+                "Google Alert label=%s need=%d skipped_feed_date=%d skipped_title=%d scraped=%d kept=%d",
+                label,
+                need,
+                alert_stats["skipped_feed_date"],
+                alert_stats["skipped_title"],
+                alert_stats["scraped"],
+                len(alert_articles),
             )
             alert_articles = dedup_alert_articles(articles, alert_articles)
             for article in alert_articles:
@@ -295,16 +478,31 @@ def main():
         latest_final_dt = articles[0].get("final_dt") if articles else None
         oldest_final_dt = articles[-1].get("final_dt") if articles else None
         logging.info(
-            "Date stats label=%s scraped=%d serper=%d url=%d missing=%d outside_window=%d latest=%s oldest=%s",
+            "Date stats label=%s scraped=%d serper=%d url=%d missing=%d outside_window=%d skipped_prefetch=%d skipped_probe=%d latest=%s oldest=%s",
             label,
             date_stats["scraped_date_used"],
             date_stats["serper_date_used"],
             date_stats["url_date_used"],
             date_stats["missing_published_at"],
             date_stats["outside_window"],
+            date_stats["skipped_prefetch"],
+            date_stats["skipped_probe"],
             latest_final_dt.isoformat() if latest_final_dt else None,
             oldest_final_dt.isoformat() if oldest_final_dt else None,
         )
+        logging.info(
+            "Fetch memo label=%s run_hits=%d run_misses=%d",
+            label,
+            fetch_memo.hits,
+            fetch_memo.misses,
+        )
+        if seen_store is not None:
+            logging.info(
+                "Seen store label=%s seen_previously=%d skipped_fetch=%d",
+                label,
+                date_stats["seen_previously"],
+                date_stats["skipped_seen"],
+            )
         if date_stats["missing_samples"]:
             logging.info("Missing published_at samples label=%s urls=%s", label, date_stats["missing_samples"])
         if date_stats["outside_window_samples"]:
@@ -323,10 +521,20 @@ def main():
                 date_stats["serper_date_samples"][:5],
             )
 
-        apply_scores(articles, notion_rules=notion_rules)
+        return label, articles
+
+    def export_label(item):
+        nonlocal notion_failures
+        label, articles = item
+        apply_scores(articles, notion_rules=notion_rules, engine_rules=engine_rules)
         deduped_articles, dedup_stats = deduplicate_articles(articles)
         all_articles_for_storage = deduped_articles
-        articles_for_summary, hard_excluded_articles = apply_hard_exclusion(deduped_articles, hard_exclusion_rules)
+        # The full RuleSet is passed so exclusion reuses the evaluation apply_scores cached on each article.
+        articles_for_summary, hard_excluded_articles = apply_hard_exclusion(deduped_articles, engine_rules)
+        repeated_articles = []
+        if story_index is not None:
+            # Near-duplicates of stories reported on earlier days are still saved, but not summarized again.
+            articles_for_summary, repeated_articles = story_index.split_reported(articles_for_summary)
 
         all_articles_for_storage.sort(
             key=lambda x: (x.get("score", 0), x.get("final_dt")),
@@ -357,6 +565,15 @@ def main():
             [a.get("url", "") for a in articles_for_summary[:label_pick_limit]],
             [a.get("hard_exclusion_reasons", []) for a in hard_excluded_articles],
         )
+        if story_index is not None:
+            story_index.record(articles_for_summary[:label_pick_limit], label=label)
+            logging.info(
+                "Story index label=%s repeated=%d repeated_titles=%s reported_on=%s",
+                label,
+                len(repeated_articles),
+                [a.get("title", "") for a in repeated_articles],
+                [a["reported_before"]["reported_on"] for a in repeated_articles],
+            )
         if dedup_stats.get("merge_details"):
             for detail in dedup_stats["merge_details"]:
                 logging.debug(
@@ -370,10 +587,15 @@ def main():
             all_scored_articles.extend(articles_for_summary)
             for article in all_articles_for_storage:
                 article["label"] = label
-                apply_tags(article, tag_rules, notion_rules=notion_rules)
+                apply_tags(article, tag_rules, notion_rules=notion_rules, engine_rules=engine_rules)
                 if notion_exporter:
+                    article_id = compute_article_id(article.get("url", "")) if seen_store is not None else ""
+                    seen = seen_store.lookup(article_id) if article_id else None
                     try:
-                        page_id = notion_exporter.upsert_article(article)
+                        page_id = notion_exporter.upsert_article(article, known_page_id=seen.page_id if seen else None)
+                        if article_id:
+                            seen_store.remember(article_id, run_day)
+                            seen_store.set_page_id(article_id, page_id)
                         article["notion_page_id"] = page_id
                         notion_article_page_ids.append(page_id)
                         logging.info("Notion article upserted: %s", page_id)
@@ -381,24 +603,85 @@ def main():
                         notion_failures += 1
                         logging.exception("Failed to export article to Notion: %s", article.get("url"))
             if articles_for_summary:
-                sections.append({
-                    "label": label,
-                    "score": articles_for_summary[0].get("score", 0),
-                    "html": summarize_with_gpt(
-                        label,
-                        articles_for_summary[:label_pick_limit],
-                        articles_for_summary[:label_pick_limit],
-                        prompts.get("summarize_system", ""),
-                        label_openai_settings,
-                    ),
-                })
-                total_articles += len(articles_for_summary[:label_pick_limit])
-            else:
-                no_article_labels.append(label)
-        else:
-            no_article_labels.append(label)
+                return label, articles_for_summary[:label_pick_limit], articles_for_summary[0].get("score", 0)
+        no_article_labels.append(label)
+        return None
+
+    def summarize_label(item):
+        nonlocal total_articles
+        if item is None:
+            return
+        label, picked_articles, score = item
+        sections.append({
+            "label": label,
+            "score": score,
+            "html": summarize_with_gpt(
+                label,
+                picked_articles,
+                picked_articles,
+                prompts.get("summarize_system", ""),
+                label_openai_settings,
+            ),
+        })
+        total_articles += len(picked_articles)
+
+    # Labels flow through fetch -> score/export -> GPT summary; each stage
+    # keeps label order, so sections and Notion writes match a serial run.
+    # The stores commit on close, so close them even when a stage fails and
+    # a rerun can reuse what this attempt already settled.
+    try:
+        stage_stats = run_pipeline(
+            labels,
+            [("fetch", collect_label), ("export", export_label), ("summarize", summarize_label)],
+            queue_size=settings.get("limits", {}).get("pipeline_queue_size", 2),
+        )
+    finally:
+        if seen_store is not None:
+            seen_store.close(run_day)
+        if story_index is not None:
+            story_index.close()
+    for stage in stage_stats:
+        logging.info(
+            "Pipeline stage=%s labels=%d busy=%.1fs idle=%.1fs blocked=%.1fs",
+            stage.name,
+            stage.items,
+            stage.busy,
+            stage.idle,
+            stage.blocked,
+        )
 
-        time.sleep(1)
+    if page_cache is not None:
+        logging.info(
+            "HTTP page cache: revalidated=%d stored=%d expired=%d evicted=%d",
+            page_cache.stats["revalidated"],
+            page_cache.stats["stored"],
+            page_cache.stats["expired"],
+            page_cache.stats["evicted"],
+        )
+
+    logging.info(
+        "Article downloads: truncated=%d rejected_content_type=%d",
+        fetch_stats.get("truncated"),
+        fetch_stats.get("rejected_content_type"),
+    )
+    if fetch_options["probe"] is not None:
+        probed = fetch_stats.get("probed")
+        logging.info(
+            "Head probe: probed=%d skipped=%d hit_rate=%.1f%% bytes_saved=%d",
+            probed,
+            fetch_stats.get("probe_skipped"),
+            100.0 * fetch_stats.get("probe_skipped") / probed if probed else 0.0,
+            fetch_stats.get("probe_bytes_saved"),
+        )
+    host_wait_stats = host_scheduler.wait_stats()
+    for host, stats in sorted(host_wait_stats.items(), key=lambda item: item[1]["total_wait"], reverse=True)[:10]:
+        logging.info(
+            "Host queue wait host=%s requests=%d total_wait=%.1fs max_wait=%.1fs",
+            host,
+            stats["requests"],
+            stats["total_wait"],
+            stats["max_wait"],
+        )
 
     sections.sort(key=lambda item: item["score"], reverse=True)
     sections_html = "".join(section["html"] for section in sections)
@@ -467,6 +750,15 @@ def main():
         except Exception:
             logging.exception("Failed to create daily summary in Notion")
 
+    for session_name, stats in sorted(connection_stats().items()):
+        logging.info(
+            "HTTP connections session=%s requests=%d new=%d reused=%d",
+            session_name,
+            stats["requests"],
+            stats["new_connections"],
+            stats["reused_connections"],
+        )
+
 
 if __name__ == "__main__":
     main()
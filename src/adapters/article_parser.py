@@ -1,10 +1,90 @@
-import json
+import itertools
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 
-from src.domain.time_utils import parse_publish_datetime
+from src.adapters.html_encoding import detect_html_encoding
+from src.adapters.html_extractor import extract_page, published_from_jsonld, published_from_meta
+from src.adapters.http_session import get_session
+from src.domain.article_text import article_text
+from src.domain.notion_utils import normalize_url
+from src.domain.time_utils import is_within_window
+
+FAILED_FETCH = (None, None, None, None)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_HEAD_END = re.compile(rb"</head\s*>|<body[\s>]", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class DownloadLimits:
+    max_bytes: int = 0
+    allowed_content_types: tuple = ()
+
+    @classmethod
+    def from_settings(cls, settings):
+        conf = (settings or {}).get("fetch", {}) or {}
+        return cls(
+            max_bytes=int(conf.get("max_bytes") or 0),
+            allowed_content_types=tuple(t.lower() for t in conf.get("allowed_content_types") or ()),
+        )
+
+    def allows(self, content_type):
+        if not self.allowed_content_types or not content_type:
+            return True
+        return content_type.split(";")[0].strip().lower() in self.allowed_content_types
+
+
+@dataclass(frozen=True)
+class HeadProbe:
+    """Date check on the page <head> before the body is downloaded.
+
+    Pages whose head already dates them outside the window are abandoned
+    after at most ``max_bytes``; undated pages are downloaded as usual.
+    """
+
+    window_start: object
+    window_end: object
+    max_bytes: int = 32 * 1024
+
+    @classmethod
+    def from_settings(cls, settings, window_start, window_end):
+        conf = (settings or {}).get("fetch", {}) or {}
+        if not conf.get("head_probe"):
+            return None
+        return cls(window_start, window_end, max_bytes=int(conf.get("head_probe_bytes") or 32 * 1024))
+
+    def published_outside_window(self, head, content_type, reference_time):
+        """Return ``(published_dt, source)`` when the head dates the page outside the window."""
+        page = extract_page(head.decode(detect_html_encoding(head, content_type), errors="replace"))
+        published_dt = published_from_meta(page.meta, reference_time)
+        published_source = "meta"
+        if not published_dt:
+            published_dt = published_from_jsonld(page.jsonld, reference_time)
+            published_source = "jsonld"
+        if published_dt and not is_within_window(published_dt, self.window_start, self.window_end):
+            return published_dt, published_source
+        return None
+
+
+class FetchStats:
+    """Thread-safe download counters shared by the fetch workers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def get(self, name):
+        with self._lock:
+            return self._counts.get(name, 0)
 
 
 def extract_source_from_url(url):
@@ -15,77 +95,194 @@ def extract_source_from_url(url):
         return "Unknown"
 
 
-def _extract_meta_published(soup, reference_time):
-    meta_keys = {
-        "article:published_time",
-        "og:published_time",
-        "pubdate",
-        "publish_date",
-        "date",
-        "dc.date",
-        "dc.date.issued",
-        "datepublished",
-    }
-    for tag in soup.find_all("meta"):
-        key = (tag.get("property") or tag.get("name") or "").lower()
-        if key in meta_keys:
-            content = tag.get("content")
-            published = parse_publish_datetime(content, reference_time)
-            if published:
-                return published
-    return None
-
-
-def _extract_jsonld_published(soup, reference_time):
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            payload = json.loads(script.string or "{}")
-        except json.JSONDecodeError:
-            continue
-        if isinstance(payload, dict) and "@graph" in payload:
-            nodes = payload.get("@graph", [])
-        else:
-            nodes = payload if isinstance(payload, list) else [payload]
-        for node in nodes:
-            if not isinstance(node, dict):
-                continue
-            published = node.get("datePublished") or node.get("dateModified")
-            published_dt = parse_publish_datetime(published, reference_time)
-            if published_dt:
-                return published_dt
-    return None
-
-
-def fetch_article(url, reference_time):
+def _read_limited(chunks, max_bytes):
+    parts = []
+    size = 0
+    for chunk in chunks:
+        if max_bytes and size + len(chunk) > max_bytes:
+            parts.append(chunk[: max_bytes - size])
+            return b"".join(parts), True
+        parts.append(chunk)
+        size += len(chunk)
+    return b"".join(parts), False
+
+
+def _read_head(chunks, max_bytes):
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= max_bytes or _HEAD_END.search(head):
+            break
+    return head
+
+
+def _unread_bytes(response, decoded_read):
+    """Bytes of the response left unread, when the server sent a Content-Length."""
     try:
-        r = requests.get(url, timeout=20, headers={"User-Agent": "Mozilla/5.0"})
-        soup = BeautifulSoup(r.text, "html.parser")
-
-        paragraphs = []
-        for p in soup.find_all("p"):
-            t = p.get_text().strip()
-            if len(t) < 30:
-                continue
-            if any(x in t for x in ["会員", "登録", "利用規約", "著作権", "JavaScript", "Cookie", "広告"]):
-                continue
-            paragraphs.append(t)
-
-        body = "\n".join(paragraphs)
-        published_dt = _extract_meta_published(soup, reference_time)
-        published_source = "meta"
-        if not published_dt:
-            published_dt = _extract_jsonld_published(soup, reference_time)
-            published_source = "jsonld"
-        if not published_dt:
-            published_source = "unknown"
+        length = int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        return 0
+    try:
+        # urllib3 counts the (possibly compressed) bytes taken off the socket.
+        read = int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        read = decoded_read
+    return max(0, length - read)
+
+
+def _download_html(url, cache=None, session=None, limits=None, stats=None, probe=None, reference_time=None):
+    """Return ``(html, probed)``; ``probed`` is the head probe's ``(published_dt, source)`` when it stopped the download."""
+    limits = limits or DownloadLimits()
+    headers = {"User-Agent": "Mozilla/5.0"}
+    cached = cache.lookup(url) if cache is not None else None
+    if cached:
+        headers.update(cached.validator_headers())
+    with (session or get_session("articles")).get(url, timeout=20, headers=headers, stream=True) as r:
+        if cached and r.status_code == 304:
+            cache.mark_revalidated(cached)
+            return cached.text(), None
+        content_type = r.headers.get("Content-Type")
+        if not limits.allows(content_type):
+            if stats is not None:
+                stats.increment("rejected_content_type")
+            return None, None
+        chunk_size = min(DOWNLOAD_CHUNK_SIZE, probe.max_bytes) if probe is not None else DOWNLOAD_CHUNK_SIZE
+        chunks = (chunk for chunk in r.iter_content(chunk_size=chunk_size) if chunk)
+        if probe is not None:
+            head = _read_head(chunks, probe.max_bytes)
+            probed = probe.published_outside_window(head, content_type, reference_time)
+            if stats is not None:
+                stats.increment("probed")
+            if probed:
+                if stats is not None:
+                    stats.increment("probe_skipped")
+                    stats.increment("probe_bytes_saved", _unread_bytes(r, len(head)))
+                return None, probed
+            chunks = itertools.chain([head], chunks)
+        content, truncated = _read_limited(chunks, limits.max_bytes)
+        if truncated and stats is not None:
+            stats.increment("truncated")
+        encoding = detect_html_encoding(content, content_type)
+        if cache is not None:
+            cache.store(url, r, content, encoding)
+    return content.decode(encoding, errors="replace"), None
+
 
+def parse_article_html(html, reference_time):
+    """Return ``(body, published_dt, published_source)`` for a downloaded page."""
+    page = extract_page(html)
+
+    paragraphs = []
+    for text in page.paragraphs:
+        t = text.strip()
+        if len(t) < 30:
+            continue
+        if any(x in t for x in ["会員", "登録", "利用規約", "著作権", "JavaScript", "Cookie", "広告"]):
+            continue
+        paragraphs.append(t)
+
+    body = "\n".join(paragraphs)
+    published_dt = published_from_meta(page.meta, reference_time)
+    published_source = "meta"
+    if not published_dt:
+        published_dt = published_from_jsonld(page.jsonld, reference_time)
+        published_source = "jsonld"
+    if not published_dt:
+        published_source = "unknown"
+    return body, published_dt, published_source
+
+
+def fetch_article(url, reference_time, cache=None, session=None, scheduler=None, limits=None, stats=None, probe=None):
+    try:
+        with scheduler.slot(url) if scheduler is not None else nullcontext():
+            html, probed = _download_html(
+                url,
+                cache=cache,
+                session=session,
+                limits=limits,
+                stats=stats,
+                probe=probe,
+                reference_time=reference_time,
+            )
+        if probed:
+            # Dated outside the window by its <head>; no body was downloaded.
+            published_dt, published_source = probed
+            return "", published_dt, "", published_source
+        if html is None:
+            return FAILED_FETCH
+        body, published_dt, published_source = parse_article_html(html, reference_time)
         return body, published_dt, body[:3000], published_source
     except requests.RequestException:
-        return None, None, None, None
+        return FAILED_FETCH
+
+
+class ArticleFetchMemo:
+    """Run-wide memo of fetch_article results keyed by canonical URL.
+
+    Concurrent requests for the same URL wait for the first download instead
+    of issuing their own, so each page is fetched and parsed at most once.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fetch(self, url, reference_time, **fetch_options):
+        key = normalize_url(url) or url
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+            event = self._pending.get(key)
+            owner = event is None
+            if owner:
+                self.misses += 1
+                event = self._pending[key] = threading.Event()
+            else:
+                self.hits += 1
+
+        if not owner:
+            event.wait()
+            return self._results.get(key, FAILED_FETCH)
+
+        try:
+            result = fetch_article(url, reference_time, **fetch_options)
+            with self._lock:
+                self._results[key] = result
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+
+def fetch_articles(urls, reference_time, max_workers=8, memo=None, **fetch_options):
+    """Fetch many URLs with a bounded worker pool; results keep the input order.
+
+    ``fetch_options`` are forwarded to fetch_article (e.g. ``cache``, ``session``, ``scheduler``, ``limits``, ``stats``, ``probe``).
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    def fetch_one(url):
+        if memo is not None:
+            return memo.fetch(url, reference_time, **fetch_options)
+        return fetch_article(url, reference_time, **fetch_options)
+
+    workers = max(1, min(int(max_workers or 1), len(urls)))
+    if workers == 1:
+        return [fetch_one(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch_one, urls))
 
 
 def classify_article(article):
-    text = (article["title"] + article["body"]).lower()
+    view = article_text(article)
+    text = view.title + view.body
 
     if any(k in text for k in ["stock", "share", "株価", "target price", "52-week", "analyst"]):
         return "STOCK"
@@ -1,9 +1,21 @@
+import json
+import os
 import re
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
 import feedparser
 
-from src.domain.time_utils import parse_publish_datetime, is_within_hours, ensure_aware_utc, is_within_window
+from src.domain.time_utils import (
+    ensure_aware_utc,
+    is_clearly_outside_window,
+    is_within_hours,
+    is_within_window,
+    parse_publish_datetime,
+)
 from src.adapters.article_parser import fetch_article, classify_article, extract_source_from_url
 
 
@@ -26,63 +38,194 @@ def normalize_google_alert_url(url):
     return url
 
 
-def fetch_google_alert_articles(label, google_alert_rss, reference_time, hours=24, window_start=None, window_end=None):
+@dataclass
+class FeedPoll:
+    url: str
+    entries: list = field(default_factory=list)
+    status: int = None
+    elapsed: float = 0.0
+    not_modified: bool = False
+    error: bool = False
+
+
+class FeedStateStore:
+    """ETag/Last-Modified and the last entries of each feed, kept between runs.
+
+    The entries are what a 304 response stands for, so they are replayed
+    instead of re-downloading and re-parsing an unchanged feed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._feeds = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._feeds = json.load(f).get("feeds", {})
+        except (OSError, ValueError):
+            self._feeds = {}
+
+    @classmethod
+    def from_settings(cls, settings):
+        conf = (settings or {}).get("google_alert", {}) or {}
+        if not conf.get("conditional_polling"):
+            return None
+        return cls(conf.get("state_path", ".cache/google_alert_feeds.json"))
+
+    def get(self, url):
+        return self._feeds.get(url) or {}
+
+    def update(self, url, etag, modified, entries):
+        self._feeds[url] = {"etag": etag, "modified": modified, "entries": entries}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"feeds": self._feeds}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def _entry_fields(entry):
+    return {"title": entry.get("title", ""), "link": entry.get("link", ""), "published": entry.get("published")}
+
+
+def _poll_feed(url, state, parse):
+    saved = state.get(url) if state is not None else {}
+    started = time.monotonic()
+    try:
+        feed = parse(url, etag=saved.get("etag"), modified=saved.get("modified"))
+    except Exception:
+        return FeedPoll(url=url, elapsed=time.monotonic() - started, error=True)
+    elapsed = time.monotonic() - started
+    status = feed.get("status")
+    if status == 304 and saved:
+        return FeedPoll(url=url, entries=saved.get("entries", []), status=status, elapsed=elapsed, not_modified=True)
+    entries = [_entry_fields(e) for e in feed.entries]
+    if state is not None and (feed.get("etag") or feed.get("modified")):
+        state.update(url, feed.get("etag"), feed.get("modified"), entries)
+    return FeedPoll(url=url, entries=entries, status=status, elapsed=elapsed, error=bool(feed.get("bozo") and not entries))
+
+
+def poll_feeds(rss_urls, state=None, max_workers=8, parse=feedparser.parse):
+    """Poll every feed once, concurrently, sending the stored ETag/Last-Modified.
+
+    Returns ``{rss_url: FeedPoll}``; a 304 replays the entries kept in ``state``.
+    """
+    urls = list(dict.fromkeys(rss_urls))
+    if not urls:
+        return {}
+    workers = max(1, min(int(max_workers or 1), len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        polls = list(executor.map(lambda url: _poll_feed(url, state, parse), urls))
+    if state is not None:
+        state.save()
+    return {poll.url: poll for poll in polls}
+
+
+def fetch_google_alert_articles(
+    label,
+    google_alert_rss,
+    reference_time,
+    hours=24,
+    window_start=None,
+    window_end=None,
+    fetch_memo=None,
+    fetch_options=None,
+    feed_polls=None,
+    serper_articles=None,
+    need=None,
+    tolerance=timedelta(0),
+    stats=None,
+):
+    """Scrape the label's alert entries that can still make it into the summary.
+
+    Before any download, entries whose feed date is outside the window by
+    more than ``tolerance`` and entries whose title collides with
+    ``serper_articles`` are dropped. Entries are scraped newest first (by
+    feed date) and scraping stops once ``need`` articles are collected.
+    """
     articles = []
+    fetch_options = fetch_options or {}
+    stats = stats if stats is not None else {}
+    for key in ("skipped_feed_date", "skipped_title", "scraped"):
+        stats.setdefault(key, 0)
 
     rss_urls = google_alert_rss.get(label, [])
     if not rss_urls:
         return articles
 
+    serper_keys = {_title_key(a["title"]) for a in serper_articles or []}
+    candidates = []
     for rss_url in rss_urls:
-        feed = feedparser.parse(rss_url)
+        if feed_polls is not None and rss_url in feed_polls:
+            entries = feed_polls[rss_url].entries
+        else:
+            entries = feedparser.parse(rss_url).entries
 
-        for e in feed.entries:
+        for e in entries:
             title = e.get("title", "")
-            raw_url = e.get("link", "")
-            url = normalize_google_alert_url(raw_url)
-
             published = parse_publish_datetime(e.get("published"), reference_time)
-            body, scraped_dt, body_excerpt, published_source = fetch_article(url, reference_time)
-            if not body:
+            if window_start and window_end and is_clearly_outside_window(published, window_start, window_end, tolerance):
+                stats["skipped_feed_date"] += 1
+                continue
+            if _title_key(title) in serper_keys:
+                stats["skipped_title"] += 1
                 continue
+            candidates.append((title, e.get("link", ""), published))
+
+    # Newest first, so stopping at ``need`` keeps the most recent entries.
+    candidates.sort(key=lambda item: ensure_aware_utc(item[2]) or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+
+    for title, raw_url, published in candidates:
+        if need is not None and len(articles) >= need:
+            break
+        url = normalize_google_alert_url(raw_url)
+        stats["scraped"] += 1
+        if fetch_memo is not None:
+            body, scraped_dt, body_excerpt, published_source = fetch_memo.fetch(url, reference_time, **fetch_options)
+        else:
+            body, scraped_dt, body_excerpt, published_source = fetch_article(url, reference_time, **fetch_options)
+        if not body:
+            continue
 
-            final_dt = ensure_aware_utc(scraped_dt or published)
-            if window_start and window_end:
-                if not is_within_window(final_dt, window_start, window_end):
-                    continue
-            elif not is_within_hours(final_dt, reference_time, hours=hours):
+        final_dt = ensure_aware_utc(scraped_dt or published)
+        if window_start and window_end:
+            if not is_within_window(final_dt, window_start, window_end):
                 continue
+        elif not is_within_hours(final_dt, reference_time, hours=hours):
+            continue
 
-            articles.append({
-                "title": title,
-                "body": body_excerpt,
-                "body_full": body,
-                "body_preview": body_excerpt,
-                "url": url,
-                "date": None,
-                "source": extract_source_from_url(url),
-                "final_dt": final_dt,
-                "published_at": final_dt.isoformat() if final_dt else None,
-                "published_source": published_source or "unknown",
-                "type": classify_article({
-                    "title": title,
-                    "body": body
-                }),
-            })
+        article = {
+            "title": title,
+            "body": body_excerpt,
+            "body_full": body,
+            "body_preview": body_excerpt,
+            "url": url,
+            "date": None,
+            "source": extract_source_from_url(url),
+            "final_dt": final_dt,
+            "published_at": final_dt.isoformat() if final_dt else None,
+            "published_source": published_source or "unknown",
+        }
+        article["type"] = classify_article(article)
+        articles.append(article)
 
     articles.sort(key=lambda x: x["final_dt"], reverse=True)
     return articles
 
 
+def _title_key(title):
+    return re.sub(r"\W+", "", title.lower())[:50]
+
+
 def dedup_alert_articles(serper_articles, alert_articles):
-    serper_keys = set(
-        re.sub(r"\W+", "", a["title"].lower())[:50]
-        for a in serper_articles
-    )
+    serper_keys = set(_title_key(a["title"]) for a in serper_articles)
 
     results = []
     for a in alert_articles:
-        key = re.sub(r"\W+", "", a["title"].lower())[:50]
+        key = _title_key(a["title"])
         if key in serper_keys:
             continue
         results.append(a)
@@ -0,0 +1,89 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+def host_key(url):
+    try:
+        netloc = urlparse(url).netloc.lower()
+    except ValueError:
+        return ""
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+class _HostState:
+    def __init__(self, max_concurrency):
+        self.semaphore = threading.Semaphore(max_concurrency)
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class HostScheduler:
+    """Per-host politeness: bounded concurrency and minimum request spacing.
+
+    Requests to different hosts never wait on each other; requests to the
+    same host queue for one of ``max_per_host`` slots and start at least
+    ``min_interval`` seconds apart.
+    """
+
+    def __init__(self, max_per_host=2, min_interval=1.0, clock=time.monotonic, sleep=time.sleep):
+        self.max_per_host = max(1, int(max_per_host))
+        self.min_interval = max(0.0, float(min_interval))
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        limits = (settings or {}).get("limits", {}) or {}
+        return cls(
+            max_per_host=limits.get("per_host_concurrency", 2),
+            min_interval=limits.get("per_host_min_interval_seconds", 1.0),
+        )
+
+    def _state(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_per_host)
+            return state
+
+    @contextmanager
+    def slot(self, url):
+        state = self._state(host_key(url))
+        queued_at = self._clock()
+        state.semaphore.acquire()
+        try:
+            with state.lock:
+                now = self._clock()
+                start_at = max(now, state.next_start)
+                state.next_start = start_at + self.min_interval
+            if start_at > now:
+                self._sleep(start_at - now)
+            waited = self._clock() - queued_at
+            with state.lock:
+                state.requests += 1
+                state.total_wait += waited
+                state.max_wait = max(state.max_wait, waited)
+            yield
+        finally:
+            state.semaphore.release()
+
+    def wait_stats(self):
+        """Per-host request count and queue wait in seconds."""
+        with self._lock:
+            hosts = dict(self._hosts)
+        stats = {}
+        for host, state in hosts.items():
+            with state.lock:
+                stats[host] = {
+                    "requests": state.requests,
+                    "total_wait": state.total_wait,
+                    "max_wait": state.max_wait,
+                }
+        return stats
@@ -0,0 +1,68 @@
+import codecs
+import re
+
+import requests
+
+# <meta charset> must appear early in <head>; real pages often push it past
+# the 1024 bytes the HTML spec allows, so look a little further.
+DECLARATION_SCAN_BYTES = 16 * 1024
+# Statistical detection is only run over this prefix of the body.
+DETECTION_BYTES = 64 * 1024
+
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]*?charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# Labels that browsers decode with a superset codec. Japanese sites declaring
+# Shift_JIS routinely use the Windows-31J extensions (①, ㈱, NEC row 13).
+_CODEC_OVERRIDES = {
+    "shift_jis": "cp932",
+    "shift-jis": "cp932",
+    "sjis": "cp932",
+    "x-sjis": "cp932",
+    "ms_kanji": "cp932",
+    "windows-31j": "cp932",
+}
+
+
+def _normalize_charset(label):
+    if not label:
+        return None
+    if isinstance(label, bytes):
+        label = label.decode("ascii", errors="ignore")
+    label = label.strip().lower()
+    label = _CODEC_OVERRIDES.get(label, label)
+    try:
+        codecs.lookup(label)
+    except LookupError:
+        return None
+    return label
+
+
+def charset_from_content_type(content_type):
+    match = _HEADER_CHARSET.search(content_type or "")
+    return _normalize_charset(match.group(1)) if match else None
+
+
+def charset_from_declaration(content):
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    match = _META_CHARSET.search(content[:DECLARATION_SCAN_BYTES])
+    return _normalize_charset(match.group(1)) if match else None
+
+
+def detect_html_encoding(content, content_type=None):
+    """Pick the codec for an HTML body without decoding all of it.
+
+    Order: charset in the Content-Type header, BOM or <meta charset>/http-equiv
+    declaration near the top of the page, then detection over a bounded prefix.
+    """
+    encoding = charset_from_content_type(content_type) or charset_from_declaration(content)
+    if encoding:
+        return encoding
+    detected = requests.compat.chardet.detect(content[:DETECTION_BYTES])["encoding"]
+    return _normalize_charset(detected) or "utf-8"
@@ -0,0 +1,237 @@
+import json
+import re
+from dataclasses import dataclass
+from html.entities import html5
+from html.parser import HTMLParser
+
+from src.domain.time_utils import parse_publish_datetime
+
+META_PUBLISHED_KEYS = {
+    "article:published_time",
+    "og:published_time",
+    "pubdate",
+    "publish_date",
+    "date",
+    "dc.date",
+    "dc.date.issued",
+    "datepublished",
+}
+
+# Tree-building rules of BeautifulSoup's html.parser builder, which the
+# extractor mirrors so that its output matches the previous soup-based code.
+VOID_ELEMENTS = frozenset({
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image",
+    "img", "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source",
+    "spacer", "track", "wbr",
+})
+# Text inside these tags is not part of get_text().
+STRING_CONTAINERS = frozenset({"rt", "rp", "style", "script", "template"})
+PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+ASCII_SPACES = " \n\t\x0c\r"
+
+_ENTITIES = {name[:-1]: char for name, char in html5.items() if name.endswith(";")}
+_WINDOWS_1252 = {}
+for _code in range(0x80, 0xA0):
+    try:
+        _WINDOWS_1252[_code] = bytes([_code]).decode("cp1252")
+    except UnicodeDecodeError:
+        pass
+_NONCHARACTERS = frozenset(
+    [0xFFFE, 0xFFFF] + [plane * 0x10000 + low for plane in range(1, 17) for low in (0xFFFE, 0xFFFF)]
+)
+_DECIMAL_WITH_TAIL = re.compile(r"^([0-9]+)(.*)")
+_HEX_WITH_TAIL = re.compile(r"^([0-9a-f]+)(.*)")
+
+
+def _numeric_reference(name):
+    base, pattern = 10, _DECIMAL_WITH_TAIL
+    if name[:1] in ("x", "X"):
+        name, base, pattern = name[1:], 16, _HEX_WITH_TAIL
+    tail = ""
+    try:
+        number = int(name, base)
+    except ValueError:
+        match = pattern.search(name)
+        if not match:
+            return "", name
+        number, tail = int(match.group(1), base), match.group(2)
+
+    if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+        return "\ufffd", tail
+    if 0xFDD0 <= number <= 0xFDEF or number in _NONCHARACTERS:
+        return chr(number), tail
+    if number in _WINDOWS_1252:
+        return _WINDOWS_1252[number], tail
+    return chr(number), tail
+
+
+@dataclass
+class ExtractedPage:
+    paragraphs: list
+    meta: list
+    jsonld: list
+
+
+class _ArticleParser(HTMLParser):
+    """Collect paragraph text, <meta> pairs and JSON-LD in one pass."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.paragraphs = []
+        self.meta = []
+        self.jsonld = []
+        self._stack = []
+        self._open_paragraphs = []
+        self._containers = 0
+        self._preserve = 0
+        self._segment = []
+        # Void tags opened with <tag>; a later </tag> for them is swallowed
+        # without ending the current text segment, as BeautifulSoup does.
+        self._closed_void = []
+
+    def _flush(self, cdata=False):
+        if not self._segment:
+            return
+        text = "".join(self._segment)
+        self._segment = []
+        if not self._preserve and all(ch in ASCII_SPACES for ch in text):
+            text = "\n" if "\n" in text else " "
+        if self._stack and self._stack[-1][2] is not None and not cdata:
+            self.jsonld[self._stack[-1][2]].append(text)
+        if cdata or not self._containers:
+            for index in self._open_paragraphs:
+                self.paragraphs[index].append(text)
+
+    def _record_meta(self, tag, attrs):
+        if tag != "meta":
+            return
+        values = {key: "" if value is None else value for key, value in attrs}
+        key = (values.get("property") or values.get("name") or "").lower()
+        self.meta.append((key, values.get("content")))
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        self._record_meta(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            self._closed_void.append(tag)
+            return
+        jsonld_index = None
+        if tag == "script":
+            values = {key: "" if value is None else value for key, value in attrs}
+            if values.get("type") == "application/ld+json":
+                jsonld_index = len(self.jsonld)
+                self.jsonld.append([])
+        if tag == "p":
+            self._open_paragraphs.append(len(self.paragraphs))
+            self.paragraphs.append([])
+        self._containers += tag in STRING_CONTAINERS
+        self._preserve += tag in PRESERVE_WHITESPACE
+        self._stack.append((tag, tag == "p", jsonld_index))
+
+    def handle_startendtag(self, tag, attrs):
+        # <tag/> opens and closes immediately, so it can hold no text.
+        self._flush()
+        self._record_meta(tag, attrs)
+        if tag == "p":
+            self.paragraphs.append([])
+        elif tag == "script":
+            values = {key: "" if value is None else value for key, value in attrs}
+            if values.get("type") == "application/ld+json":
+                self.jsonld.append([])
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        self._flush()
+        if tag in VOID_ELEMENTS:
+            return
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > position:
+            name, is_paragraph, _ = self._stack.pop()
+            if is_paragraph:
+                self._open_paragraphs.pop()
+            self._containers -= name in STRING_CONTAINERS
+            self._preserve -= name in PRESERVE_WHITESPACE
+
+    def handle_data(self, data):
+        self._segment.append(data)
+
+    def handle_entityref(self, name):
+        self._segment.append(_ENTITIES.get(name, f"&{name}"))
+
+    def handle_charref(self, name):
+        character, tail = _numeric_reference(name)
+        self._segment.append(character)
+        if tail:
+            self._segment.append(tail)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.upper().startswith("CDATA["):
+            self._segment.append(data[len("CDATA["):])
+            self._flush(cdata=True)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def extract_page(html):
+    """Parse ``html`` once and return its paragraphs, meta tags and JSON-LD blocks.
+
+    ``paragraphs`` holds the text of every <p> in document order (nested
+    paragraphs included), ``meta`` the ``(property-or-name, content)`` pair
+    of every <meta>, and ``jsonld`` the script text of every
+    ``application/ld+json`` block (None when it is not a single string).
+    """
+    parser = _ArticleParser()
+    parser.feed(html)
+    parser.close()
+    return ExtractedPage(
+        paragraphs=["".join(parts) for parts in parser.paragraphs],
+        meta=parser.meta,
+        jsonld=[parts[0] if len(parts) == 1 else None for parts in parser.jsonld],
+    )
+
+
+def published_from_meta(meta, reference_time):
+    for key, content in meta:
+        if key in META_PUBLISHED_KEYS:
+            published = parse_publish_datetime(content, reference_time)
+            if published:
+                return published
+    return None
+
+
+def published_from_jsonld(jsonld, reference_time):
+    for text in jsonld:
+        try:
+            payload = json.loads(text or "{}")
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict) and "@graph" in payload:
+            nodes = payload.get("@graph", [])
+        else:
+            nodes = payload if isinstance(payload, list) else [payload]
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            published = node.get("datePublished") or node.get("dateModified")
+            published_dt = parse_publish_datetime(published, reference_time)
+            if published_dt:
+                return published_dt
+    return None
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    url: str
+    content: bytes
+    encoding: str
+    etag: str
+    last_modified: str
+    stored_at: float
+
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def validator_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpPageCache:
+    """On-disk page cache revalidated with ETag/Last-Modified.
+
+    Entries older than ``ttl_seconds`` are dropped, and the least recently
+    used entries are evicted once the directory exceeds ``max_bytes``.
+    Only responses carrying a validator are stored, because anything else
+    could never be answered with a 304.
+    """
+
+    def __init__(self, directory, ttl_seconds=72 * 3600, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.stats = {"revalidated": 0, "stored": 0, "expired": 0, "evicted": 0}
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    @classmethod
+    def from_settings(cls, settings):
+        conf = (settings or {}).get("http_cache", {}) or {}
+        if not conf.get("enabled"):
+            return None
+        return cls(
+            conf.get("dir", ".cache/http"),
+            ttl_seconds=float(conf.get("ttl_hours", 72)) * 3600,
+            max_bytes=int(float(conf.get("max_mb", 200)) * 1024 * 1024),
+        )
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _scan(self):
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def _remove(self, meta_path, body_path):
+        removed = 0
+        for path in (meta_path, body_path):
+            try:
+                if path == body_path:
+                    removed = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+        self._total_bytes = max(0, self._total_bytes - removed)
+
+    def lookup(self, url):
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(body_path, "rb") as f:
+                    content = f.read()
+            except (OSError, ValueError):
+                return None
+            if time.time() - meta.get("stored_at", 0) > self.ttl_seconds:
+                self.stats["expired"] += 1
+                self._remove(meta_path, body_path)
+                return None
+            os.utime(body_path)
+        return CachedPage(
+            url=url,
+            content=content,
+            encoding=meta.get("encoding") or "utf-8",
+            etag=meta.get("etag") or "",
+            last_modified=meta.get("last_modified") or "",
+            stored_at=meta.get("stored_at", 0),
+        )
+
+    def mark_revalidated(self, page):
+        """Record a 304 for ``page`` and restart its TTL."""
+        meta_path, _ = self._paths(page.url)
+        with self._lock:
+            self.stats["revalidated"] += 1
+            self._write_meta(meta_path, page.url, page.encoding, page.etag, page.last_modified)
+
+    def store(self, url, response, content, encoding):
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        if len(content) > self.max_bytes:
+            return
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            previous = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            tmp_path = f"{body_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, body_path)
+            self._write_meta(meta_path, url, encoding, etag, last_modified)
+            self._total_bytes += len(content) - previous
+            self.stats["stored"] += 1
+            self._evict()
+
+    def _write_meta(self, meta_path, url, encoding, etag, last_modified):
+        tmp_path = f"{meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "url": url,
+                    "encoding": encoding,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "stored_at": time.time(),
+                },
+                f,
+            )
+        os.replace(tmp_path, meta_path)
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        entries = sorted(self._scan(), key=lambda item: item[2])
+        for body_path, _, _ in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            meta_path = body_path[: -len(".body")] + ".json"
+            self._remove(meta_path, body_path)
+            self.stats["evicted"] += 1
@@ -0,0 +1,110 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# Pool sizes per adapter: pool_connections is the number of hosts kept,
+# pool_maxsize the keep-alive connections per host.
+SESSION_PROFILES = {
+    "articles": {"pool_connections": 64, "pool_maxsize": 8},
+    "serper": {"pool_connections": 1, "pool_maxsize": 4},
+    "openai": {"pool_connections": 1, "pool_maxsize": 4},
+    "notion": {"pool_connections": 1, "pool_maxsize": 4},
+    "yahoo": {"pool_connections": 2, "pool_maxsize": 4},
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class _ConnectionCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": max(0, self.requests - self.new_connections),
+            }
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that counts requests and newly opened connections."""
+
+    def __init__(self, *args, **kwargs):
+        self.counter = _ConnectionCounter()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        counter = self.counter
+
+        def counting(pool_class):
+            def _new_conn(pool):
+                counter.add_connection()
+                return pool_class._new_conn(pool)
+
+            return type(f"Counting{pool_class.__name__}", (pool_class,), {"_new_conn": _new_conn})
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": counting(HTTPConnectionPool),
+            "https": counting(HTTPSConnectionPool),
+        }
+
+    def send(self, request, **kwargs):
+        self.counter.add_request()
+        return super().send(request, **kwargs)
+
+
+def _default_retry():
+    # Only retry failures to connect. Status and read retries stay with the
+    # callers (e.g. NotionClient backs off on 429/5xx itself).
+    return Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.5, raise_on_status=False)
+
+
+def build_session(pool_connections=10, pool_maxsize=10, retry=None):
+    session = requests.Session()
+    adapter = CountingHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry if retry is not None else _default_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(name):
+    """Return the shared session for an adapter, creating it on first use."""
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = build_session(**SESSION_PROFILES.get(name, {}))
+            _sessions[name] = session
+        return session
+
+
+def connection_stats():
+    """Per-session request and connection counts for the run log."""
+    with _sessions_lock:
+        sessions = dict(_sessions)
+    stats = {}
+    for name, session in sessions.items():
+        adapter = session.get_adapter("https://")
+        if isinstance(adapter, CountingHTTPAdapter):
+            stats[name] = adapter.counter.snapshot()
+    return stats
@@ -2,10 +2,13 @@ import random
 import time
 import requests
 
+from src.adapters.http_session import get_session
+
 
 class NotionClient:
-    def __init__(self, token, audit_logger=None, max_retries=5, base_url="https://api.notion.com/v1"):
+    def __init__(self, token, audit_logger=None, max_retries=5, base_url="https://api.notion.com/v1", session=None):
         self.token = token
+        self.session = session or get_session("notion")
         self.base_url = base_url
         self.max_retries = max_retries
         self.audit_logger = audit_logger
@@ -20,7 +23,7 @@ class NotionClient:
     def _request(self, method, path, json_body=None, params=None):
         url = f"{self.base_url}{path}"
         for attempt in range(self.max_retries):
-            response = requests.request(
+            response = self.session.request(
                 method,
                 url,
                 headers=self._headers(),
@@ -1,10 +1,21 @@
 import logging
 import re
 
+import requests
+
 from src.adapters.notion_audit import write_audit_log
 from src.domain.notion_utils import compute_article_id, compute_body_hash, normalize_url
 
 
+def _is_missing_page_error(error):
+    """True when Notion rejected a page update because the page is gone or archived."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status == 404:
+        return True
+    return status == 400 and "archived" in (getattr(response, "text", "") or "").lower()
+
+
 def truncate_text(text, max_len):
     if not text:
         return ""
@@ -382,7 +393,12 @@ class NotionExporter:
         blocks = build_paragraph_blocks([self.FULL_SUMMARY_MARKER] + chunks)
         self.client.append_block_children(page_id, {"children": blocks})
 
-    def upsert_article(self, article):
+    def upsert_article(self, article, known_page_id=None):
+        """Create or update the article page and return its id.
+
+        ``known_page_id`` (from an earlier run) skips the ArticleId query; if
+        that page was deleted or archived, the page is looked up as usual.
+        """
         normalized_url = normalize_url(article.get("url", ""))
         article_id = compute_article_id(normalized_url)
         body_sources = [
@@ -399,8 +415,16 @@ class NotionExporter:
             self._log_error(article.get("url", ""), "missing_article_id", error)
             raise error
         try:
-            page = self._find_article_page(article_id)
             properties = self._build_article_properties(article, normalized_url, article_id, body_hash, body_preview)
+            if known_page_id:
+                try:
+                    self.client.update_page(known_page_id, {"properties": properties})
+                    return known_page_id
+                except requests.HTTPError as exc:
+                    if not _is_missing_page_error(exc):
+                        raise
+                    self._log_error(article.get("url", ""), "update_known_page_failed", exc)
+            page = self._find_article_page(article_id)
             if page:
                 page_id = page["id"]
                 self.client.update_page(page_id, {"properties": properties})
@@ -3,7 +3,7 @@ import logging
 import os
 import re
 
-import requests
+from src.adapters.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -217,11 +217,11 @@ def _extract_reasoning_tokens(usage):
     return int(details.get("reasoning_tokens") or 0)
 
 
-def _call_openai_chat(messages, model="gpt-4o-mini", temperature=0.2, timeout=120):
+def _call_openai_chat(messages, model="gpt-4o-mini", temperature=0.2, timeout=120, session=None):
     api_key = _get_openai_api_key()
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is empty")
-    res = requests.post(
+    res = (session or get_session("openai")).post(
         "https://api.openai.com/v1/chat/completions",
         headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
         json={"model": model, "messages": messages, "temperature": temperature},
@@ -248,7 +248,7 @@ def _extract_responses_text(data):
     return None
 
 
-def _call_openai_responses(input_text, model="gpt-5-mini", reasoning_effort="medium", verbosity="medium", max_output_tokens=2200, timeout=180, prompt_chars=None):
+def _call_openai_responses(input_text, model="gpt-5-mini", reasoning_effort="medium", verbosity="medium", max_output_tokens=2200, timeout=180, prompt_chars=None, session=None):
     api_key = _get_openai_api_key()
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is empty")
@@ -256,8 +256,9 @@ def _call_openai_responses(input_text, model="gpt-5-mini", reasoning_effort="med
     original_reasoning_effort = reasoning_effort
     current_max_output_tokens = max_output_tokens
     current_reasoning_effort = reasoning_effort
+    session = session or get_session("openai")
     while retry <= 1:
-        res = requests.post(
+        res = session.post(
             "https://api.openai.com/v1/responses",
             headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
             json={
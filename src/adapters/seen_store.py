@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_articles (
+    article_id TEXT PRIMARY KEY,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    published_at TEXT,
+    body_hash TEXT,
+    page_id TEXT
+)
+"""
+
+
+@dataclass(frozen=True)
+class SeenArticle:
+    article_id: str
+    first_seen: str
+    last_seen: str
+    published_at: object
+    body_hash: str
+    page_id: str
+
+
+class SeenArticleStore:
+    """SQLite table of articles processed on earlier runs, keyed by compute_article_id.
+
+    Each row keeps the first/last run date it was seen on, the published_at the
+    run settled on, the body hash and the Notion page id, so the next day can
+    skip downloading known out-of-window pages and update known pages without
+    querying Notion first. Rows not seen for ``retention_days`` are pruned.
+    """
+
+    def __init__(self, path, retention_days=30):
+        self.path = path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def from_settings(cls, settings):
+        conf = (settings or {}).get("seen_store", {}) or {}
+        if not conf.get("enabled"):
+            return None
+        return cls(
+            conf.get("path", ".cache/seen_articles.sqlite3"),
+            retention_days=int(conf.get("retention_days", 30)),
+        )
+
+    def lookup(self, article_id):
+        if not article_id:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT article_id, first_seen, last_seen, published_at, body_hash, page_id"
+                " FROM seen_articles WHERE article_id = ?",
+                (article_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        published_at = datetime.fromisoformat(row[3]) if row[3] else None
+        return SeenArticle(row[0], row[1], row[2], published_at, row[4] or "", row[5] or "")
+
+    def remember(self, article_id, seen_on, published_at=None, body_hash=None):
+        """Record that ``article_id`` was seen on run date ``seen_on``; the first date is kept."""
+        if not article_id:
+            return
+        seen_on = seen_on.isoformat()
+        published = published_at.isoformat() if published_at else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen_articles (article_id, first_seen, last_seen, published_at, body_hash)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(article_id) DO UPDATE SET"
+                " last_seen = excluded.last_seen,"
+                " published_at = COALESCE(excluded.published_at, published_at),"
+                " body_hash = COALESCE(excluded.body_hash, body_hash)",
+                (article_id, seen_on, seen_on, published, body_hash),
+            )
+
+    def set_page_id(self, article_id, page_id):
+        if not article_id:
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE seen_articles SET page_id = ? WHERE article_id = ?",
+                (page_id, article_id),
+            )
+
+    def close(self, today):
+        """Prune rows not seen within the retention period, commit and close."""
+        cutoff = (today - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            self._conn.execute("DELETE FROM seen_articles WHERE last_seen < ?", (cutoff,))
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,80 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+
+class SerperResultCache:
+    """On-disk cache of Serper news results so that reruns cost no credits.
+
+    Entries are keyed by the query payload (q, timeRange, hl, num, page) and the
+    JST date of the run window start, and expire after ``ttl_seconds``.
+    With ``refresh`` set, lookups always miss but fresh results are stored.
+    """
+
+    def __init__(self, directory, ttl_seconds=12 * 3600, refresh=False):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "expired": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, settings, refresh=False):
+        conf = (settings or {}).get("serper_cache", {}) or {}
+        if not conf.get("enabled"):
+            return None
+        return cls(
+            conf.get("dir", ".cache/serper"),
+            ttl_seconds=float(conf.get("ttl_hours", 12)) * 3600,
+            refresh=refresh,
+        )
+
+    def _path(self, payload, window_start):
+        # Weekday windows start "24 hours before now", so bucket by date or
+        # a rerun minutes later would never hit.
+        window_key = window_start.date().isoformat() if window_start else ""
+        raw = json.dumps(
+            [
+                payload.get("q"),
+                payload.get("timeRange"),
+                payload.get("hl"),
+                payload.get("num"),
+                payload.get("page", 1),
+                window_key,
+            ],
+            ensure_ascii=False,
+        )
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def get(self, payload, window_start):
+        if self.refresh:
+            self.stats["misses"] += 1
+            return None
+        path = self._path(payload, window_start)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        self.stats["hits"] += 1
+        return entry.get("news", [])
+
+    def put(self, payload, window_start, news):
+        path = self._path(payload, window_start)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"q": payload.get("q"), "stored_at": time.time(), "news": news}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.stats["stored"] += 1
@@ -1,27 +1,149 @@
+from dataclasses import dataclass
+
 import requests
 
+from src.adapters.http_session import get_session
 from src.config.env import SERPER_API_KEY
 
+SERPER_NEWS_URL = "https://google.serper.dev/news"
+# Serper accepts at most 100 queries per batch request.
+SERPER_BATCH_SIZE = 100
+
+
+def _headers():
+    return {
+        "X-API-KEY": SERPER_API_KEY,
+        "Content-Type": "application/json",
+    }
+
+
+@dataclass(frozen=True)
+class SerperPaging:
+    """How deep to page Serper results per label.
+
+    The default is the historical single request of 500 results. In adaptive
+    mode the first page holds ``num`` results, and a label pages deeper only
+    while it has fewer than ``target`` usable articles.
+    """
+
+    num: int = 500
+    max_pages: int = 1
+    target: int = 0
+
+    @classmethod
+    def from_settings(cls, settings):
+        conf = (settings or {}).get("serper", {}) or {}
+        if not conf.get("adaptive"):
+            return cls()
+        limits = (settings or {}).get("limits", {}) or {}
+        return cls(
+            num=int(conf.get("page_size", 20)),
+            max_pages=max(1, int(conf.get("max_pages", 5))),
+            target=int(conf.get("target_articles") or limits.get("max_articles_per_label", 5)),
+        )
+
+
+def _query_payload(query, num=500, page=1):
+    payload = {
+        "q": query,
+        "num": num,
+        "timeRange": "d1",
+        "hl": "en",
+    }
+    if page > 1:
+        payload["page"] = page
+    return payload
 
-def search_serper(query):
+
+def search_serper(query, session=None, cache=None, window_start=None, num=500, page=1):
+    payload = _query_payload(query, num, page)
+    if cache is not None:
+        cached = cache.get(payload, window_start)
+        if cached is not None:
+            return cached
     try:
-        res = requests.post(
-            "https://google.serper.dev/news",
-            headers={
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json",
-            },
-            json={
-                "q": query,
-                "num": 500,
-                "timeRange": "d1",
-                "hl": "en",
-            },
+        res = (session or get_session("serper")).post(
+            SERPER_NEWS_URL,
+            headers=_headers(),
+            json=payload,
             timeout=30,
         )
         if res.status_code == 402:
             return "SERPER_CREDIT_ERROR"
         res.raise_for_status()
-        return res.json().get("news", [])
+        news = res.json().get("news", [])
     except requests.RequestException:
         return "SERPER_CREDIT_ERROR"
+    if cache is not None:
+        cache.put(payload, window_start, news)
+    return news
+
+
+def _post_batch(payloads, session):
+    """Per-payload results of one batch request.
+
+    Only an HTTP 402 marks the whole batch as a credit error. A network error
+    or an unusable body returns None, and an unusable item maps to None, so
+    the caller can retry those queries instead of losing them.
+    """
+    try:
+        res = session.post(
+            SERPER_NEWS_URL,
+            headers=_headers(),
+            json=payloads,
+            timeout=60,
+        )
+        if res.status_code == 402:
+            return ["SERPER_CREDIT_ERROR"] * len(payloads)
+        res.raise_for_status()
+        payload = res.json()
+    except (requests.RequestException, ValueError):
+        return None
+    if not isinstance(payload, list) or len(payload) != len(payloads):
+        return None
+    return [item.get("news", []) if isinstance(item, dict) else None for item in payload]
+
+
+def search_serper_batch(
+    queries,
+    session=None,
+    batch_size=SERPER_BATCH_SIZE,
+    cache=None,
+    window_start=None,
+    num=500,
+    page=1,
+):
+    """Search many queries in as few requests as possible.
+
+    Returns ``{query: results}`` for every distinct query. A batch rejected
+    with HTTP 402 maps each of its queries to ``"SERPER_CREDIT_ERROR"``; any
+    other failed batch is retried once, and queries still without results are
+    then sent one by one through search_serper. Queries found in ``cache``
+    are not sent.
+    ``num``/``page`` select which page of results is requested.
+    """
+    session = session or get_session("serper")
+    unique = list(dict.fromkeys(queries))
+    results = {}
+    pending = []
+    for query in unique:
+        cached = cache.get(_query_payload(query, num, page), window_start) if cache is not None else None
+        if cached is not None:
+            results[query] = cached
+        else:
+            pending.append(query)
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start : start + batch_size]
+        payloads = [_query_payload(q, num, page) for q in chunk]
+        batch_results = _post_batch(payloads, session)
+        if batch_results is None:
+            batch_results = _post_batch(payloads, session)
+        if batch_results is None:
+            batch_results = [None] * len(payloads)
+        for query, payload, news in zip(chunk, payloads, batch_results):
+            if news is None:
+                news = search_serper(query, session=session, num=num, page=page)
+            results[query] = news
+            if cache is not None and news != "SERPER_CREDIT_ERROR":
+                cache.put(payload, window_start, news)
+    return {query: results[query] for query in unique}
@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import threading
+from datetime import timedelta
+
+from src.domain.article_dedup import SIMHASH_MAX_DISTANCE, DedupFingerprint, SimHashIndex
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reported_stories (
+    simhash INTEGER NOT NULL,
+    reported_on TEXT NOT NULL,
+    label TEXT,
+    title TEXT,
+    url TEXT
+)
+"""
+
+
+def _to_signed(value):
+    # SQLite integers are signed 64-bit.
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+class RecentStoryIndex:
+    """SimHashes of article bodies reported in the last ``days`` days.
+
+    Rows live in SQLite and are loaded into a SimHashIndex on open, so each
+    lookup only compares against stored hashes sharing a block with the query.
+    Matches from the current run date are ignored, so reruns on the same day
+    do not suppress their own stories.
+    """
+
+    def __init__(self, path, today, days=7, max_distance=SIMHASH_MAX_DISTANCE):
+        self.path = path
+        self.today = today
+        self.days = days
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(
+            "DELETE FROM reported_stories WHERE reported_on < ?",
+            ((today - timedelta(days=days)).isoformat(),),
+        )
+        self._conn.commit()
+        self._index = SimHashIndex(max_distance=max_distance)
+        rows = self._conn.execute("SELECT simhash, reported_on, title, url FROM reported_stories")
+        for value, reported_on, title, url in rows:
+            self._index.add(_to_unsigned(value), {"reported_on": reported_on, "title": title, "url": url})
+
+    @classmethod
+    def from_settings(cls, settings, today):
+        conf = (settings or {}).get("story_index", {}) or {}
+        if not conf.get("enabled"):
+            return None
+        return cls(
+            conf.get("path", ".cache/story_index.sqlite3"),
+            today,
+            days=int(conf.get("days", 7)),
+            max_distance=int(conf.get("max_distance", SIMHASH_MAX_DISTANCE)),
+        )
+
+    def __len__(self):
+        return len(self._index)
+
+    def find_reported(self, article):
+        """The earlier report ``article`` near-duplicates, or None."""
+        value = DedupFingerprint.from_article(article).simhash()
+        if value is None:
+            return None
+        today = self.today.isoformat()
+        with self._lock:
+            matches = self._index.near(value)
+        for _, _, reported in matches:
+            if reported["reported_on"] < today:
+                return reported
+        return None
+
+    def split_reported(self, articles):
+        """Return ``(fresh, repeated)``; repeated articles get ``reported_before`` set."""
+        fresh = []
+        repeated = []
+        for article in articles:
+            reported = self.find_reported(article)
+            if reported is None:
+                fresh.append(article)
+            else:
+                article["reported_before"] = reported
+                repeated.append(article)
+        return fresh, repeated
+
+    def record(self, articles, label=""):
+        """Remember ``articles`` as reported today."""
+        rows = []
+        for article in articles:
+            value = DedupFingerprint.from_article(article).simhash()
+            if value is None:
+                continue
+            item = {"reported_on": self.today.isoformat(), "title": article.get("title", ""), "url": article.get("url", "")}
+            rows.append((value, item))
+        with self._lock:
+            for value, item in rows:
+                self._index.add(value, item)
+            self._conn.executemany(
+                "INSERT INTO reported_stories (simhash, reported_on, label, title, url) VALUES (?, ?, ?, ?, ?)",
+                [(_to_signed(value), item["reported_on"], label, item["title"], item["url"]) for value, item in rows],
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -3,16 +3,17 @@ from datetime import datetime, timezone
 
 import requests
 
+from src.adapters.http_session import get_session
 from src.config.env import HEADERS
 from src.domain.time_utils import JST
 
 FX_RATES = {}
 
 
-def fetch_fx_rates():
+def fetch_fx_rates(session=None):
     try:
         url = "https://query1.finance.yahoo.com/v7/finance/quote?symbols=USDJPY=X,VNDJPY=X"
-        r = requests.get(url, headers=HEADERS, timeout=10)
+        r = (session or get_session("yahoo")).get(url, headers=HEADERS, timeout=10)
         r.raise_for_status()
 
         results = r.json()["quoteResponse"]["result"]
@@ -28,11 +29,11 @@ def fetch_fx_rates():
         FX_RATES["VND"] = 0.006
 
 
-def fetch_stock_from_quote(ticker):
+def fetch_stock_from_quote(ticker, session=None):
     quote_url = "https://query1.finance.yahoo.com/v7/finance/quote"
 
     try:
-        r = requests.get(
+        r = (session or get_session("yahoo")).get(
             quote_url,
             params={"symbols": ticker},
             headers=HEADERS,
@@ -1,6 +1,8 @@
 import difflib
+import hashlib
 import re
 import unicodedata
+from dataclasses import dataclass
 from datetime import datetime
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
@@ -10,6 +12,27 @@ TITLE_SUFFIX_PATTERN = re.compile(r"\s*(?:[-|｜]\s*(?:reuters|ロイター|bloo
 NON_WORD_PATTERN = re.compile(r"[^\w\s]")
 WHITESPACE_PATTERN = re.compile(r"\s+")
 
+# MinHash/LSH pre-filter for the body-similarity stage. A SequenceMatcher
+# ratio of 0.92 on the 1200-char prefixes leaves at worst ~0.43 Jaccard on
+# 5-char shingles (edits spread so each breaks 5 shingles); 64 bands of 2
+# rows make such a pair a candidate with probability
+# 1 - (1 - 0.43**2)**64 > 0.999998. Candidates are still verified with
+# body_similarity, so the outcome matches comparing all pairs.
+SHINGLE_SIZE = 5
+MINHASH_BINS = 128
+LSH_ROWS = 2
+LSH_MIN_THRESHOLD = 0.9
+BODY_COMPARE_CHARS = 1200
+MIN_BODY_CHARS = 300
+_EMPTY_BIN = 1 << 64
+
+# SimHash for near-duplicates across days. On 1200-char prefixes, 3-char
+# shingles keep lightly edited copies within ~4 bits while unrelated
+# bodies stay 15+ bits apart.
+SIMHASH_BITS = 64
+SIMHASH_SHINGLE_SIZE = 3
+SIMHASH_MAX_DISTANCE = 4
+
 
 def safe_float(value, default=0.0):
     try:
@@ -66,12 +89,179 @@ def normalize_body_for_dedup(body):
     return normalize_text(body)
 
 
-def body_similarity(article_a, article_b, *, compare_chars=1200):
-    body_a = normalize_body_for_dedup(article_a.get("body_full") or article_a.get("body") or "")
-    body_b = normalize_body_for_dedup(article_b.get("body_full") or article_b.get("body") or "")
-    if len(body_a) < 300 or len(body_b) < 300:
+def _body_prefix(article, compare_chars):
+    """Normalized body prefix to compare, or "" when the body is too short."""
+    body = normalize_body_for_dedup(article.get("body_full") or article.get("body") or "")
+    if len(body) < MIN_BODY_CHARS:
+        return ""
+    return body[:compare_chars]
+
+
+def _prefix_similarity(prefix_a, prefix_b):
+    if not prefix_a or not prefix_b:
         return 0.0
-    return difflib.SequenceMatcher(None, body_a[:compare_chars], body_b[:compare_chars]).ratio()
+    return difflib.SequenceMatcher(None, prefix_a, prefix_b).ratio()
+
+
+def body_similarity(article_a, article_b, *, compare_chars=BODY_COMPARE_CHARS):
+    return _prefix_similarity(_body_prefix(article_a, compare_chars), _body_prefix(article_b, compare_chars))
+
+
+@dataclass(frozen=True)
+class DedupFingerprint:
+    """Everything deduplicate_articles compares, normalized once per article."""
+
+    url_key: str
+    title_key: str
+    body_prefix: str
+    day: object = None
+
+    @classmethod
+    def from_article(cls, article):
+        final_dt = article.get("final_dt")
+        return cls(
+            url_key=normalize_url(article.get("url")),
+            title_key=normalize_title_for_dedup(article.get("title")),
+            body_prefix=_body_prefix(article, BODY_COMPARE_CHARS),
+            day=final_dt.date() if isinstance(final_dt, datetime) else None,
+        )
+
+    def same_day(self, other):
+        return self.day is not None and self.day == other.day
+
+    def similarity(self, other):
+        return _prefix_similarity(self.body_prefix, other.body_prefix)
+
+    def simhash(self):
+        """SimHash of the body prefix, or None when the body is too short to compare."""
+        return simhash(self.body_prefix) if self.body_prefix else None
+
+
+def _shingle_hash(shingle):
+    # blake2b rather than hash(): signatures must not depend on PYTHONHASHSEED.
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(text, *, shingle_size=SHINGLE_SIZE, bins=MINHASH_BINS):
+    """One-permutation MinHash of the character shingles of ``text``.
+
+    Each shingle is hashed once; the low bits pick a bin and the remaining
+    bits compete for that bin's minimum. Empty bins borrow the next
+    non-empty bin's value (rotation densification) so that every position
+    stays comparable between signatures.
+    """
+    shingles = {text[i : i + shingle_size] for i in range(max(1, len(text) - shingle_size + 1))}
+    signature = [_EMPTY_BIN] * bins
+    for shingle in shingles:
+        value = _shingle_hash(shingle)
+        index = value % bins
+        value //= bins
+        if value < signature[index]:
+            signature[index] = value
+    if all(value == _EMPTY_BIN for value in signature):
+        return tuple(signature)
+    for index in range(bins):
+        if signature[index] != _EMPTY_BIN:
+            continue
+        distance = 1
+        while signature[(index + distance) % bins] == _EMPTY_BIN:
+            distance += 1
+        signature[index] = signature[(index + distance) % bins] + distance * _EMPTY_BIN
+    return tuple(signature)
+
+
+class MinHashLSH:
+    """Banded LSH index over MinHash signatures."""
+
+    def __init__(self, *, rows=LSH_ROWS):
+        self.rows = rows
+        self._buckets = {}
+
+    def add(self, key, signature):
+        for start in range(0, len(signature) - self.rows + 1, self.rows):
+            band = (start, signature[start : start + self.rows])
+            self._buckets.setdefault(band, []).append(key)
+
+    def candidate_pairs(self):
+        """Pairs ``(a, b)`` with ``a < b`` that share at least one band."""
+        pairs = set()
+        for keys in self._buckets.values():
+            if len(keys) < 2:
+                continue
+            for pos, key in enumerate(keys):
+                for other in keys[pos + 1 :]:
+                    pairs.add((key, other) if key < other else (other, key))
+        return pairs
+
+
+def simhash(text, *, shingle_size=SIMHASH_SHINGLE_SIZE):
+    """64-bit SimHash over the character shingles of ``text``; 0 for empty text."""
+    hashes = [_shingle_hash(text[i : i + shingle_size]) for i in range(max(0, len(text) - shingle_size + 1))]
+    if not hashes:
+        return 0
+    half = len(hashes) / 2
+    value = 0
+    # Column k of the binary strings is bit (SIMHASH_BITS - 1 - k).
+    for pos, column in enumerate(zip(*(format(h, "064b") for h in hashes))):
+        if column.count("1") > half:
+            value |= 1 << (SIMHASH_BITS - 1 - pos)
+    return value
+
+
+def hamming_distance(a, b):
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """SimHashes indexed for Hamming-distance queries up to ``max_distance``.
+
+    The 64 bits are split into ``max_distance + 1`` blocks. Two hashes within
+    ``max_distance`` bits must agree exactly on at least one block, so a query
+    only compares against hashes sharing one of its block values.
+    """
+
+    def __init__(self, *, max_distance=SIMHASH_MAX_DISTANCE):
+        self.max_distance = max_distance
+        blocks = max_distance + 1
+        edges = [SIMHASH_BITS * i // blocks for i in range(blocks + 1)]
+        self._blocks = [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+        self._tables = [{} for _ in self._blocks]
+        self._values = []
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, value, item=None):
+        key = len(self._values)
+        self._values.append((value, item))
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            table.setdefault((value >> shift) & mask, []).append(key)
+
+    def near(self, value):
+        """``(distance, value, item)`` for stored hashes within range, nearest first."""
+        keys = set()
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            keys.update(table.get((value >> shift) & mask, ()))
+        matches = []
+        for key in sorted(keys):
+            stored, item = self._values[key]
+            distance = hamming_distance(value, stored)
+            if distance <= self.max_distance:
+                matches.append((distance, stored, item))
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+
+def _body_similarity_candidates(fingerprints, indexes, similarity_threshold):
+    """Index pairs worth a body similarity check, or None to compare all pairs."""
+    if similarity_threshold < LSH_MIN_THRESHOLD:
+        return None
+    index = MinHashLSH()
+    for idx in indexes:
+        body_prefix = fingerprints[idx].body_prefix
+        if body_prefix:
+            index.add(idx, minhash_signature(body_prefix))
+    return index.candidate_pairs()
 
 
 def is_same_day(article_a, article_b):
@@ -95,6 +285,33 @@ def choose_best_article(articles):
     return max(articles, key=rank)
 
 
+class _UnionFind:
+    """Disjoint sets over article indexes; a set's root is its first index."""
+
+    def __init__(self, size):
+        self._parent = list(range(size))
+
+    def find(self, idx):
+        parent = self._parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def merge(self, idx, into):
+        root, other_root = self.find(into), self.find(idx)
+        if other_root < root:
+            root, other_root = other_root, root
+        self._parent[other_root] = root
+
+    def groups(self):
+        """Member lists in index order, ordered by their first member."""
+        groups = {}
+        for idx in range(len(self._parent)):
+            groups.setdefault(self.find(idx), []).append(idx)
+        return list(groups.values())
+
+
 def deduplicate_articles(articles, *, similarity_threshold=0.92):
     if not articles:
         return [], {
@@ -106,54 +323,62 @@ def deduplicate_articles(articles, *, similarity_threshold=0.92):
             "merge_details": [],
         }
 
-    duplicates = {}
+    fingerprints = [DedupFingerprint.from_article(article) for article in articles]
+    groups = _UnionFind(len(articles))
     reason_by_removed = {}
 
     # Stage 1: normalized URL duplicates.
     by_url = {}
-    for idx, article in enumerate(articles):
-        norm_url = normalize_url(article.get("url"))
+    for idx, fingerprint in enumerate(fingerprints):
+        norm_url = fingerprint.url_key
         if norm_url and norm_url in by_url:
-            duplicates[idx] = by_url[norm_url]
+            groups.merge(idx, by_url[norm_url])
             reason_by_removed[idx] = "url"
         else:
             by_url[norm_url] = idx
 
-    # Stage 2 and 3 on URL-unique articles.
-    candidate_indexes = [idx for idx in range(len(articles)) if idx not in duplicates]
+    # Stage 2 and 3 on URL-unique articles. Each base only looks at later
+    # articles sharing its title key (title stage) or an LSH band (body
+    # stage); without LSH every later article is a body candidate.
+    candidate_indexes = [idx for idx in range(len(articles)) if idx not in reason_by_removed]
+    by_title = {}
+    for idx in candidate_indexes:
+        if fingerprints[idx].title_key:
+            by_title.setdefault(fingerprints[idx].title_key, []).append(idx)
+    body_candidates = _body_similarity_candidates(fingerprints, candidate_indexes, similarity_threshold)
+    body_partners = None
+    if body_candidates is not None:
+        body_partners = {}
+        for idx, other_idx in body_candidates:
+            body_partners.setdefault(idx, []).append(other_idx)
+
     for pos, idx in enumerate(candidate_indexes):
-        if idx in duplicates:
+        if idx in reason_by_removed:
             continue
-        base = articles[idx]
-        base_title = normalize_title_for_dedup(base.get("title"))
-        for other_idx in candidate_indexes[pos + 1:]:
-            if other_idx in duplicates:
-                continue
-            other = articles[other_idx]
-            other_title = normalize_title_for_dedup(other.get("title"))
-
-            title_duplicate = False
-            if base_title and base_title == other_title:
-                similarity = body_similarity(base, other)
-                if is_same_day(base, other) or similarity >= similarity_threshold:
-                    title_duplicate = True
-
-            if title_duplicate:
-                duplicates[other_idx] = idx
-                reason_by_removed[other_idx] = "title"
+        base = fingerprints[idx]
+        if body_partners is None:
+            others = candidate_indexes[pos + 1:]
+        else:
+            others = sorted(
+                {other_idx for other_idx in by_title.get(base.title_key, ()) if other_idx > idx}
+                | set(body_partners.get(idx, ()))
+            )
+        for other_idx in others:
+            if other_idx in reason_by_removed:
                 continue
+            other = fingerprints[other_idx]
 
-            similarity = body_similarity(base, other)
-            if similarity >= similarity_threshold:
-                duplicates[other_idx] = idx
-                reason_by_removed[other_idx] = "body_similarity"
+            if base.title_key and base.title_key == other.title_key:
+                if base.same_day(other) or base.similarity(other) >= similarity_threshold:
+                    groups.merge(other_idx, idx)
+                    reason_by_removed[other_idx] = "title"
+                    continue
 
-    groups = {}
-    for idx in range(len(articles)):
-        root = idx
-        while root in duplicates:
-            root = duplicates[root]
-        groups.setdefault(root, []).append(idx)
+            if body_candidates is not None and (idx, other_idx) not in body_candidates:
+                continue
+            if base.similarity(other) >= similarity_threshold:
+                groups.merge(other_idx, idx)
+                reason_by_removed[other_idx] = "body_similarity"
 
     deduped = []
     merge_details = []
@@ -161,7 +386,7 @@ def deduplicate_articles(articles, *, similarity_threshold=0.92):
     removed_title = 0
     removed_body = 0
 
-    for indexes in groups.values():
+    for indexes in groups.groups():
         group_articles = [articles[i] for i in indexes]
         best = choose_best_article(group_articles)
         best_idx = indexes[group_articles.index(best)]
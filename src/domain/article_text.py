@@ -0,0 +1,53 @@
+from functools import cached_property
+
+_VIEW_KEY = "_text_view"
+
+
+def _lower(value):
+    return str(value or "").lower()
+
+
+class ArticleText:
+    """Lower-cased views of an article's title and bodies, each computed on first use.
+
+    ``body`` is ``body_full`` falling back to the ``body`` excerpt, which is
+    the text classification, scoring, hard exclusion and tagging match on.
+    """
+
+    def __init__(self, title, body_full, excerpt):
+        self._title = title
+        self._body_full = body_full
+        self._excerpt = excerpt
+        # Filled by rule_engine.evaluate_article, one entry per RuleSet.
+        self.evaluations = {}
+
+    @cached_property
+    def title(self):
+        return _lower(self._title)
+
+    @cached_property
+    def body_full(self):
+        return _lower(self._body_full)
+
+    @cached_property
+    def excerpt(self):
+        return _lower(self._excerpt)
+
+    @cached_property
+    def body(self):
+        return self.body_full if self._body_full else self.excerpt
+
+
+def article_text(article):
+    """The ArticleText for ``article``, cached on the article dict.
+
+    The cached view is reused only while title/body_full/body are the very
+    same objects it was built from, so edited articles get a fresh view.
+    """
+    sources = (article.get("title", ""), article.get("body_full"), article.get("body"))
+    cached = article.get(_VIEW_KEY)
+    if cached is not None and all(old is new for old, new in zip(cached[0], sources)):
+        return cached[1]
+    view = ArticleText(*sources)
+    article[_VIEW_KEY] = (sources, view)
+    return view
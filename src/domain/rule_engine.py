@@ -1,8 +1,17 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass
 
+from src.domain.article_text import article_text
 
-def _normalize(text):
-    return (text or "").lower()
+logger = logging.getLogger(__name__)
+
+_compiled_rulesets = {}
+_compiled_rulesets_lock = threading.Lock()
 
 
 def _parse_keywords(text):
@@ -20,6 +29,137 @@ class Rule:
     priority: float
 
 
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting every occurrence of every keyword in one pass."""
+
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        goto = [{}]
+        outputs = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][ch] = nxt
+                state = nxt
+            outputs[state].append(keyword_id)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                outputs[nxt].extend(outputs[fail[nxt]])
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(ids) for ids in outputs]
+        self._lengths = [len(keyword) for keyword in self.keywords]
+
+    def _resolve(self, state, ch):
+        # Follow failure links once, then remember the transition so later
+        # scans take a single dict lookup per character.
+        origin = state
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        nxt = self._goto[state].get(ch, 0)
+        self._goto[origin][ch] = nxt
+        return nxt
+
+    def scan(self, text):
+        """Return ``(start, keyword_id)`` for every occurrence in ``text``."""
+        goto = self._goto
+        outputs = self._outputs
+        lengths = self._lengths
+        hits = []
+        state = 0
+        for end, ch in enumerate(text, 1):
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = self._resolve(state, ch)
+            state = nxt
+            if outputs[state]:
+                hits.extend((end - lengths[keyword_id], keyword_id) for keyword_id in outputs[state])
+        return hits
+
+
+class RuleSet:
+    """Rules compiled into one KeywordAutomaton over all positive and negative keywords.
+
+    ``matching_rules`` scans ``"{title} {body}"`` once and derives every
+    rule's title/body/both hits from the match offsets, with the same result
+    as calling _match_rule on each rule. Iterates like the list of rules.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        keyword_ids = {}
+        for rule in self.rules:
+            for keyword in rule.keywords + rule.negative_keywords:
+                keyword_ids.setdefault(keyword, len(keyword_ids))
+        self._automaton = KeywordAutomaton(keyword_ids)
+        self._keyword_ids = keyword_ids
+        # An empty keyword is "in" every text, as with the ``in`` operator.
+        self._empty_keyword_id = keyword_ids.get("")
+        self._rules_by_keyword = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in set(rule.keywords):
+                self._rules_by_keyword.setdefault(keyword_ids[keyword], []).append(index)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    @property
+    def keyword_count(self):
+        return len(self._keyword_ids)
+
+    def _found(self, title_text, body_text):
+        """Keyword ids found in the title, the body and the joined text."""
+        body_start = len(title_text) + 1
+        in_title, in_body, in_both = set(), set(), set()
+        if self._empty_keyword_id is not None:
+            for found in (in_title, in_body, in_both):
+                found.add(self._empty_keyword_id)
+        for start, keyword_id in self._automaton.scan(f"{title_text} {body_text}"):
+            in_both.add(keyword_id)
+            if start + len(self._automaton.keywords[keyword_id]) <= len(title_text):
+                in_title.add(keyword_id)
+            elif start >= body_start:
+                in_body.add(keyword_id)
+        return {"title": in_title, "body": in_body, "both": in_both}
+
+    def matching_rules(self, title_text, body_text):
+        """Rules that _match_rule would accept, in rule order."""
+        found = self._found(title_text, body_text)
+        candidates = set()
+        for keyword_id in found["both"]:
+            candidates.update(self._rules_by_keyword.get(keyword_id, ()))
+        matched = []
+        for index in sorted(candidates):
+            rule = self.rules[index]
+            hits = found.get(rule.match_field, found["both"])
+            if not any(self._keyword_ids[keyword] in hits for keyword in rule.keywords):
+                continue
+            if any(self._keyword_ids[keyword] in hits for keyword in rule.negative_keywords):
+                continue
+            matched.append(rule)
+        return matched
+
+
 def build_rules(raw_rules):
     rules = []
     for entry in raw_rules or []:
@@ -36,7 +176,38 @@ def build_rules(raw_rules):
             weight=float(weight) if weight is not None else 0.0,
             priority=float(priority) if priority is not None else 0.0,
         ))
-    return rules
+    return RuleSet(rules)
+
+
+def rules_content_hash(raw_rules):
+    payload = json.dumps(list(raw_rules or []), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compile_rules(raw_rules):
+    """build_rules memoized by the content hash of ``raw_rules``.
+
+    Equal rule rows compile once per process and share one RuleSet; the
+    compile time and rule counts are logged when a RuleSet is first built.
+    """
+    key = rules_content_hash(raw_rules)
+    with _compiled_rulesets_lock:
+        ruleset = _compiled_rulesets.get(key)
+        if ruleset is None:
+            started = time.perf_counter()
+            ruleset = build_rules(raw_rules)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            counts = Counter(rule.rule_type for rule in ruleset)
+            logger.info(
+                "Rules compiled: hash=%s rules=%d by_type=%s keywords=%d elapsed=%.1fms",
+                key[:12],
+                len(ruleset),
+                dict(sorted(counts.items())),
+                ruleset.keyword_count,
+                elapsed_ms,
+            )
+            _compiled_rulesets[key] = ruleset
+    return ruleset
 
 
 def _match_rule(rule, title_text, body_text):
@@ -59,9 +230,31 @@ def _match_rule(rule, title_text, body_text):
     return True
 
 
-def apply_rule_engine(article, rules):
-    title_text = _normalize(article.get("title", ""))
-    body_text = _normalize(article.get("body_full") or article.get("body") or "")
+HARD_EXCLUSION_RULE_TYPES = frozenset({"hard_exclusion", "exclude"})
+
+
+@dataclass(frozen=True)
+class ArticleEvaluation:
+    importance_score: float
+    importance_reasons: tuple
+    country_tags: tuple
+    sector_tags: tuple
+    primary_country: object
+    hard_exclusion_reasons: tuple
+
+
+def evaluate_article(article, rules):
+    """Score, tags and hard-exclusion matches for ``article`` from one keyword scan.
+
+    The result is cached per RuleSet on the article's text view, so scoring,
+    hard exclusion and tagging with the same RuleSet share a single scan.
+    """
+    if not isinstance(rules, RuleSet):
+        rules = RuleSet(rules)
+    text = article_text(article)
+    cached = text.evaluations.get(rules)
+    if cached is not None:
+        return cached
 
     country_tags = set()
     sector_tags = set()
@@ -69,11 +262,13 @@ def apply_rule_engine(article, rules):
     importance_reasons = []
     primary_country = None
     primary_priority = float("-inf")
+    hard_exclusion_reasons = []
 
-    for rule in rules:
-        if not rule.tag_name:
+    for rule in rules.matching_rules(text.title, text.body):
+        if rule.rule_type in HARD_EXCLUSION_RULE_TYPES:
+            hard_exclusion_reasons.append(f"{rule.tag_name}({rule.rule_type})")
             continue
-        if not _match_rule(rule, title_text, body_text):
+        if not rule.tag_name:
             continue
         if rule.rule_type == "country":
             country_tags.add(rule.tag_name)
@@ -86,10 +281,24 @@ def apply_rule_engine(article, rules):
             importance_score += rule.weight
             importance_reasons.append(f"{rule.tag_name}({rule.weight:+g})")
 
+    evaluation = ArticleEvaluation(
+        importance_score=importance_score,
+        importance_reasons=tuple(importance_reasons),
+        country_tags=tuple(sorted(country_tags)),
+        sector_tags=tuple(sorted(sector_tags)),
+        primary_country=primary_country,
+        hard_exclusion_reasons=tuple(hard_exclusion_reasons),
+    )
+    text.evaluations[rules] = evaluation
+    return evaluation
+
+
+def apply_rule_engine(article, rules):
+    evaluation = evaluate_article(article, rules)
     return {
-        "country_tags": sorted(country_tags),
-        "sector_tags": sorted(sector_tags),
-        "importance_score": importance_score,
-        "importance_reasons": importance_reasons,
-        "primary_country": primary_country,
+        "country_tags": list(evaluation.country_tags),
+        "sector_tags": list(evaluation.sector_tags),
+        "importance_score": evaluation.importance_score,
+        "importance_reasons": list(evaluation.importance_reasons),
+        "primary_country": evaluation.primary_country,
     }
@@ -127,3 +127,11 @@ def is_within_window(dt, start, end):
     start_utc = ensure_aware_utc(start)
     end_utc = ensure_aware_utc(end)
     return start_utc <= dt_utc <= end_utc
+
+
+def is_clearly_outside_window(dt, start, end, tolerance=timedelta(0)):
+    """Return True only when ``dt`` is known and outside the window by more than ``tolerance``."""
+    if not dt:
+        return False
+    dt_utc = ensure_aware_utc(dt)
+    return dt_utc < ensure_aware_utc(start) - tolerance or dt_utc > ensure_aware_utc(end) + tolerance
@@ -0,0 +1,97 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class StageStats:
+    name: str
+    items: int = 0
+    busy: float = 0.0
+    idle: float = 0.0
+    blocked: float = 0.0
+
+
+def run_pipeline(items, stages, queue_size=2, clock=time.monotonic):
+    """Push ``items`` through ``stages`` connected by bounded queues.
+
+    ``stages`` is a list of ``(name, fn)``; each stage gets the previous
+    stage's return value and runs in its own thread (the first one in the
+    caller's thread), so stage N of one item overlaps stage N-1 of the next
+    while every stage still sees items in input order. The first exception
+    stops all stages and is re-raised here.
+
+    Returns one StageStats per stage: ``busy`` is time inside ``fn``,
+    ``idle`` time waiting for input and ``blocked`` time waiting for room
+    in the next queue.
+    """
+    stats = [StageStats(name) for name, _ in stages]
+    if not stages:
+        return stats
+    queues = [queue.Queue(maxsize=max(1, int(queue_size))) for _ in stages[1:]]
+    stop = threading.Event()
+    errors = []
+
+    def put(outbox, item, stat):
+        started = clock()
+        while not stop.is_set():
+            try:
+                outbox.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        stat.blocked += clock() - started
+
+    def get(inbox, stat):
+        started = clock()
+        try:
+            while not stop.is_set():
+                try:
+                    return inbox.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return _DONE
+        finally:
+            stat.idle += clock() - started
+
+    def run_stage(index):
+        _, fn = stages[index]
+        stat = stats[index]
+        inbox = queues[index - 1] if index > 0 else None
+        outbox = queues[index] if index < len(queues) else None
+        source = iter(items) if inbox is None else None
+        try:
+            while not stop.is_set():
+                item = next(source, _DONE) if inbox is None else get(inbox, stat)
+                if item is _DONE:
+                    break
+                started = clock()
+                result = fn(item)
+                stat.busy += clock() - started
+                stat.items += 1
+                if outbox is not None:
+                    put(outbox, result, stat)
+        except BaseException as exc:
+            errors.append(exc)
+            stop.set()
+        finally:
+            if outbox is not None:
+                put(outbox, _DONE, stat)
+
+    threads = [
+        threading.Thread(target=run_stage, args=(index,), name=f"pipeline-{name}", daemon=True)
+        for index, (name, _) in enumerate(stages)
+        if index > 0
+    ]
+    for thread in threads:
+        thread.start()
+    run_stage(0)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return stats
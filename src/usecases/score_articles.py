@@ -1,4 +1,4 @@
-from src.domain.rule_engine import apply_rule_engine, build_rules
+from src.domain.rule_engine import compile_rules, evaluate_article
 
 
 def _importance_label(score):
@@ -9,15 +9,16 @@ def _importance_label(score):
     return "Low"
 
 
-def apply_scores(articles, notion_rules):
-    engine_rules = build_rules(notion_rules)
+def apply_scores(articles, notion_rules, engine_rules=None):
+    if engine_rules is None:
+        engine_rules = compile_rules(notion_rules)
     has_importance_rules = any(rule.rule_type == "importance" for rule in engine_rules)
 
     for article in articles:
         if has_importance_rules:
-            result = apply_rule_engine(article, engine_rules)
-            score = result["importance_score"]
-            reasons = result["importance_reasons"]
+            evaluation = evaluate_article(article, engine_rules)
+            score = evaluation.importance_score
+            reasons = evaluation.importance_reasons
         else:
             score, reasons = 0.0, []
         article["score"] = score
@@ -1,4 +1,6 @@
-from src.domain.rule_engine import _match_rule, Rule
+from src.domain.notion_utils import normalize_url
+from src.domain.rule_engine import HARD_EXCLUSION_RULE_TYPES, RuleSet, evaluate_article
+from src.domain.time_utils import is_within_window
 
 
 def importance_value(article):
@@ -12,21 +14,23 @@ def importance_value(article):
 
 
 def extract_hard_exclusion_rules(engine_rules):
-    return [rule for rule in (engine_rules or []) if rule.rule_type in {"hard_exclusion", "exclude"}]
+    return RuleSet(rule for rule in (engine_rules or []) if rule.rule_type in HARD_EXCLUSION_RULE_TYPES)
 
 
 def apply_hard_exclusion(articles, hard_exclusion_rules):
+    """Split off articles matching hard-exclusion rules.
+
+    ``hard_exclusion_rules`` may be the full RuleSet; only hard-exclusion
+    rule types exclude, and the scan is shared with scoring and tagging.
+    """
     if not hard_exclusion_rules:
         return list(articles), []
+    if not isinstance(hard_exclusion_rules, RuleSet):
+        hard_exclusion_rules = RuleSet(hard_exclusion_rules)
 
     kept, excluded = [], []
     for article in articles:
-        title_text = str(article.get("title", "")).lower()
-        body_text = str(article.get("body_full") or article.get("body") or "").lower()
-        matched = []
-        for rule in hard_exclusion_rules:
-            if _match_rule(rule, title_text, body_text):
-                matched.append(f"{rule.tag_name}({rule.rule_type})")
+        matched = list(evaluate_article(article, hard_exclusion_rules).hard_exclusion_reasons)
         if matched:
             cloned = dict(article)
             cloned["hard_exclusion_reasons"] = matched
@@ -36,6 +40,17 @@ def apply_hard_exclusion(articles, hard_exclusion_rules):
     return kept, excluded
 
 
+def count_summary_candidates(articles, window_start, window_end, hard_exclusion_rules):
+    """Distinct in-window articles that survive hard exclusion."""
+    in_window = {}
+    for article in articles:
+        if is_within_window(article.get("final_dt"), window_start, window_end):
+            url = article.get("url", "")
+            in_window.setdefault(normalize_url(url) or url, article)
+    kept, _ = apply_hard_exclusion(list(in_window.values()), hard_exclusion_rules)
+    return len(kept)
+
+
 def sort_for_summary(articles):
     return sorted(articles, key=lambda x: (importance_value(x), x.get("final_dt")), reverse=True)
 
@@ -1,5 +1,6 @@
 from src.config.yaml_loader import load_yaml
-from src.domain.rule_engine import apply_rule_engine, build_rules
+from src.domain.article_text import article_text
+from src.domain.rule_engine import compile_rules, evaluate_article
 
 
 def _normalize(text):
@@ -20,17 +21,19 @@ def load_tag_rules(path="config/tagging.yml"):
     return load_yaml(path)
 
 
-def apply_tags(article, rules=None, notion_rules=None):
-    if notion_rules:
-        engine_rules = build_rules(notion_rules)
-        result = apply_rule_engine(article, engine_rules)
-        article["country_tags"] = result["country_tags"]
-        article["sector_tags"] = result["sector_tags"]
-        article["primary_country"] = result["primary_country"]
+def apply_tags(article, rules=None, notion_rules=None, engine_rules=None):
+    if engine_rules is None and notion_rules:
+        engine_rules = compile_rules(notion_rules)
+    if engine_rules:
+        evaluation = evaluate_article(article, engine_rules)
+        article["country_tags"] = list(evaluation.country_tags)
+        article["sector_tags"] = list(evaluation.sector_tags)
+        article["primary_country"] = evaluation.primary_country
         return article
 
     rules = rules or load_tag_rules()
-    text = _normalize(article.get("title", "")) + " " + _normalize(article.get("body_full", "")) + " " + _normalize(article.get("body", ""))
+    view = article_text(article)
+    text = f"{view.title} {view.body_full} {view.excerpt}"
     countries = _match_keywords(text, rules.get("countries", {}))
     sectors = _match_keywords(text, rules.get("sectors", {}))
     article["country_tags"] = countries
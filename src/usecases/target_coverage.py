@@ -3,8 +3,12 @@ def build_processing_labels(targets, google_alert_rss):
     return sorted(set(targets.keys()) | set(google_alert_rss.keys()))
 
 
-def summarize_target_coverage(labels, targets, google_alert_rss):
-    """Return counts used for diagnostics about loaded targets."""
+def summarize_target_coverage(labels, targets, google_alert_rss, feed_polls=None):
+    """Return counts used for diagnostics about loaded targets.
+
+    When ``feed_polls`` (``{rss_url: FeedPoll}``) is given, RSS poll latency
+    and the 304 (not modified) rate are included as well.
+    """
     serper_queries = sum(len(queries) for queries in targets.values())
     rss_feeds = sum(len(feeds) for feeds in google_alert_rss.values())
 
@@ -18,10 +22,23 @@ def summarize_target_coverage(labels, targets, google_alert_rss):
         if has_serper and not has_rss:
             serper_only += 1
 
-    return {
+    stats = {
         "labels": len(labels),
         "serper_queries": serper_queries,
         "rss_feeds": rss_feeds,
         "rss_only": rss_only,
         "serper_only": serper_only,
     }
+    if feed_polls is not None:
+        polls = list(feed_polls.values())
+        latencies = [poll.elapsed for poll in polls]
+        not_modified = sum(1 for poll in polls if poll.not_modified)
+        stats.update({
+            "rss_polled": len(polls),
+            "rss_not_modified": not_modified,
+            "rss_not_modified_rate": not_modified / len(polls) if polls else 0.0,
+            "rss_poll_errors": sum(1 for poll in polls if poll.error),
+            "rss_poll_avg_seconds": sum(latencies) / len(latencies) if latencies else 0.0,
+            "rss_poll_max_seconds": max(latencies, default=0.0),
+        })
+    return stats
@@ -0,0 +1,69 @@
+"""Dedup time for synthetic label batches of 50/200/1000 articles.
+
+About a fifth of the articles are edited reposts of earlier ones and some
+share a title, so every dedup stage does real work.
+
+Usage: python tests/benchmarks/bench_article_dedup.py [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.domain.article_dedup import deduplicate_articles  # noqa: E402
+
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+BASE_DT = datetime(2024, 5, 21, tzinfo=timezone.utc)
+
+
+def _synthetic_articles(count, rng):
+    articles = []
+    for i in range(count):
+        if articles and rng.random() < 0.2:
+            source = rng.choice(articles)
+            cut = rng.randrange(400, 1000)
+            body = source["body_full"][:cut] + " 転載 " + source["body_full"][cut + 5 :]
+            title = source["title"] if rng.random() < 0.5 else f"repost {i}"
+        else:
+            words = ("".join(rng.choice(KANA) for _ in range(rng.randrange(2, 6))) for _ in range(300))
+            body = " ".join(words)
+            title = f"story {i}"
+        articles.append(
+            {
+                "title": title,
+                "url": f"https://example.com/{i}?utm_source=feed",
+                "body": body[:3000],
+                "body_full": body,
+                "score": rng.randrange(5),
+                "final_dt": BASE_DT - timedelta(hours=rng.randrange(48)),
+            }
+        )
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for count in (50, 200, 1000):
+        articles = _synthetic_articles(count, random.Random(count))
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            deduped, stats = deduplicate_articles(articles)
+        elapsed = (time.perf_counter() - started) * 1000 / args.repeat
+        print(
+            f"articles={count} kept={len(deduped)} "
+            f"removed_title={stats['removed_by_normalized_title']} "
+            f"removed_body={stats['removed_by_body_similarity']} time={elapsed:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
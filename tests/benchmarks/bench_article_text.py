@@ -0,0 +1,99 @@
+"""Per-article classify + score + hard exclusion + tagging time on the HTML fixtures.
+
+"before" drops the cached text view ahead of every step, so each step
+lower-cases and scans the article itself as it used to; "after" shares one
+view and, as main does, one RuleSet evaluation across the steps.
+
+Usage: python tests/benchmarks/bench_article_text.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.adapters.article_parser import classify_article, parse_article_html  # noqa: E402
+from src.domain.rule_engine import build_rules  # noqa: E402
+from src.domain.time_utils import JST  # noqa: E402
+from src.usecases.score_articles import apply_scores  # noqa: E402
+from src.usecases.summary_select import apply_hard_exclusion  # noqa: E402
+from src.usecases.tag_articles import apply_tags  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures" / "html"
+REFERENCE_TIME = datetime(2024, 5, 21, 12, 0, tzinfo=JST)
+KEYWORDS = [
+    "steel", "鉄鋼", "電炉", "高炉", "tariff", "関税", "price", "価格", "china", "中国", "india", "インド",
+    "nippon steel", "日本製鉄", "jfe", "posco", "baowu", "scrap", "スクラップ", "hydrogen", "水素", "rebar", "鉄筋",
+    "export", "輸出", "import", "輸入", "capacity", "設備", "recruit", "求人", "stock", "株価",
+]
+
+
+def _rules(count):
+    rule_types = ["country", "sector", "importance", "importance", "hard_exclusion"]
+    return build_rules([
+        {
+            "rule_type": rule_types[i % len(rule_types)],
+            "tag_name": f"tag{i}",
+            "keywords": ",".join(KEYWORDS[(i * 7 + k) % len(KEYWORDS)] for k in range(1 + i % 4)),
+            "negative_keywords": KEYWORDS[(i * 11) % len(KEYWORDS)] if i % 3 == 0 else "",
+            "match_field": ["both", "title", "body"][i % 3],
+            "weight": (i % 5) - 1,
+            "priority": i % 4,
+        }
+        for i in range(count)
+    ])
+
+
+def _articles():
+    articles = []
+    for path in sorted(FIXTURES.glob("*.html")):
+        body, _, _ = parse_article_html(path.read_text(encoding="utf-8"), REFERENCE_TIME)
+        # Production bodies run to 3000+ chars; repeat the fixture text to match.
+        full = "\n".join([body] * (3000 // max(1, len(body)) + 1))
+        articles.append({"title": body.splitlines()[0][:60], "body": full[:3000], "body_full": full})
+    return articles
+
+
+def _process(article, engine_rules, shared):
+    for step in (
+        lambda: classify_article(article),
+        lambda: apply_scores([article], notion_rules=None, engine_rules=engine_rules),
+        lambda: apply_hard_exclusion([article], engine_rules),
+        lambda: apply_tags(article, engine_rules=engine_rules),
+    ):
+        if not shared:
+            article.pop("_text_view", None)
+        step()
+
+
+def _per_article_ms(articles, engine_rules, repeat, shared):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for article in articles:
+            article.pop("_text_view", None)
+            _process(article, engine_rules, shared)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(articles))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--rules", type=int, default=200)
+    args = parser.parse_args()
+
+    articles = _articles()
+    engine_rules = _rules(args.rules)
+    before = _per_article_ms(articles, engine_rules, args.repeat, shared=False)
+    after = _per_article_ms(articles, engine_rules, args.repeat, shared=True)
+    print(
+        f"articles={len(articles)} rules={len(engine_rules)} body_chars={len(articles[0]['body_full'])} "
+        f"before={before:.3f}ms/article after={after:.3f}ms/article speedup={before / after:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Parse time per page: BeautifulSoup (before) vs html_extractor (after).
+
+Usage: python tests/benchmarks/bench_html_extractor.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.adapters.article_parser import parse_article_html  # noqa: E402
+from src.domain.time_utils import JST  # noqa: E402
+from tests import legacy_article_parser  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures" / "html"
+REFERENCE_TIME = datetime(2024, 5, 21, 12, 0, tzinfo=JST)
+
+
+def _per_page_ms(parse, pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parse(html, REFERENCE_TIME)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.html"))]
+    # Real article pages are far larger than the fixtures; repeat the markup
+    # so the body dominates like it does in production.
+    large = [html.replace("</body>", html.split("<body", 1)[-1] * 20, 1) for html in pages]
+
+    for name, corpus in (("fixtures", pages), ("fixtures x20", large)):
+        before = _per_page_ms(legacy_article_parser.parse_article_html, corpus, args.repeat)
+        after = _per_page_ms(parse_article_html, corpus, args.repeat)
+        print(
+            f"{name}: pages={len(corpus)} beautifulsoup={before:.3f}ms/page "
+            f"extractor={after:.3f}ms/page speedup={before / after:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
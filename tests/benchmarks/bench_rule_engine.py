@@ -0,0 +1,67 @@
+"""Rule matching time per article: one _match_rule call per rule (before) vs RuleSet (after).
+
+Usage: python tests/benchmarks/bench_rule_engine.py [--rules N] [--articles N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.domain.rule_engine import _match_rule, build_rules  # noqa: E402
+
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+ENGLISH = ["steel", "china", "india", "tariff", "price", "mill", "output", "plant", "hydrogen", "scrap", "rebar"]
+
+
+def _synthetic(rule_count, article_count, rng):
+    vocab = ["".join(rng.choice(KANA) for _ in range(rng.randrange(2, 5))) for _ in range(400)] + ENGLISH
+    raw_rules = [
+        {
+            "rule_type": rng.choice(["country", "sector", "importance", "importance", "hard_exclusion"]),
+            "tag_name": f"tag{i}",
+            "keywords": ",".join(rng.sample(vocab, rng.randrange(1, 6))),
+            "negative_keywords": ",".join(rng.sample(vocab, rng.randrange(0, 3))),
+            "match_field": rng.choice(["both", "both", "title", "body"]),
+            "weight": rng.choice([1, 2, -1]),
+            "priority": rng.randrange(5),
+        }
+        for i in range(rule_count)
+    ]
+    filler = ["".join(rng.choice(KANA) for _ in range(rng.randrange(2, 6))) for _ in range(2000)]
+    articles = []
+    for _ in range(article_count):
+        words = [rng.choice(vocab) if rng.random() < 0.05 else rng.choice(filler) for _ in range(900)]
+        articles.append((" ".join(rng.choice(vocab) for _ in range(8)), " ".join(words)[:3000]))
+    return build_rules(raw_rules), articles
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=300)
+    parser.add_argument("--articles", type=int, default=200)
+    args = parser.parse_args()
+
+    rules, articles = _synthetic(args.rules, args.articles, random.Random(0))
+
+    started = time.perf_counter()
+    before = [[rule for rule in rules if _match_rule(rule, title, body)] for title, body in articles]
+    before_ms = (time.perf_counter() - started) * 1000 / len(articles)
+
+    started = time.perf_counter()
+    after = [rules.matching_rules(title, body) for title, body in articles]
+    after_ms = (time.perf_counter() - started) * 1000 / len(articles)
+
+    assert before == after
+    print(
+        f"rules={len(rules)} articles={len(articles)} per_rule={before_ms:.3f}ms/article "
+        f"ruleset={after_ms:.3f}ms/article speedup={before_ms / after_ms:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
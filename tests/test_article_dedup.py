@@ -1,6 +1,16 @@
+import random
 from datetime import datetime, timezone
 
-from src.domain.article_dedup import deduplicate_articles, filter_negative_importance_articles
+from src.domain.article_dedup import (
+    DedupFingerprint,
+    MinHashLSH,
+    SimHashIndex,
+    deduplicate_articles,
+    filter_negative_importance_articles,
+    hamming_distance,
+    minhash_signature,
+    simhash,
+)
 
 
 def _article(**kwargs):
@@ -129,3 +139,119 @@ def test_dedup_safe_when_final_dt_missing():
 
     assert len(deduped) == 1
     assert stats["removed_by_normalized_url"] == 1
+
+
+def _random_words(rng, count=260):
+    vocabulary = [f"{a}{b}" for a in "鉄鋼電炉高炉価格需要輸出" for b in "上下増減新旧大小"] + ["steel", "furnace", "tons", "price"]
+    return " ".join(rng.choice(vocabulary) + str(rng.randint(0, 99)) for _ in range(count))
+
+
+def test_minhash_signature_is_stable_and_tracks_similarity():
+    rng = random.Random(1)
+    text = _random_words(rng)
+    edited = text[:600] + "臨時の追記" + text[605:]
+
+    signature = minhash_signature(text)
+    same = sum(a == b for a, b in zip(signature, minhash_signature(edited)))
+    other = sum(a == b for a, b in zip(signature, minhash_signature(_random_words(rng))))
+
+    assert signature == minhash_signature(text)
+    assert same > 100
+    assert other < 20
+
+
+def test_lsh_only_pairs_similar_signatures():
+    rng = random.Random(2)
+    texts = [_random_words(rng) for _ in range(20)]
+    texts.append(texts[3][:900] + "差し替え" + texts[3][904:])
+    index = MinHashLSH()
+    for key, text in enumerate(texts):
+        index.add(key, minhash_signature(text[:1200]))
+
+    assert (3, 20) in index.candidate_pairs()
+    assert len(index.candidate_pairs()) < 20
+
+
+def test_body_similarity_dedup_across_many_articles():
+    rng = random.Random(3)
+    articles = []
+    for i in range(60):
+        body = _random_words(rng)
+        articles.append(_article(title=f"story {i}", url=f"https://a.com/{i}", body=body, body_full=body))
+    # A trimmed repost, so the original stays the kept article.
+    syndicated = articles[10]["body_full"][:1000] + " 転載 " + articles[10]["body_full"][1030:]
+    articles.append(_article(title="reposted story", url="https://b.com/x", body=syndicated, body_full=syndicated))
+
+    deduped, stats = deduplicate_articles(articles)
+
+    assert len(deduped) == 60
+    assert stats["removed_by_body_similarity"] == 1
+    assert stats["merge_details"][0]["removed_title"] in {"story 10", "reposted story"}
+
+
+def test_fingerprint_normalizes_once_for_all_stages():
+    body = _long_text("Steel output, up 5%!", repeat=80)
+    fingerprint = DedupFingerprint.from_article(
+        _article(
+            title="Nippon Steel raises prices - Reuters",
+            url="https://Example.com/news/?utm_source=x&id=1",
+            body_full=body,
+            final_dt=datetime(2026, 1, 2, 23, 0, tzinfo=timezone.utc),
+        )
+    )
+    short = DedupFingerprint.from_article(_article(title="Nippon Steel raises prices", body="short body"))
+
+    assert fingerprint.url_key == "https://example.com/news?id=1"
+    assert fingerprint.title_key == short.title_key == "nippon steel raises prices"
+    assert fingerprint.body_prefix.startswith("steel output up 5 steel output")
+    assert len(fingerprint.body_prefix) == 1200
+    assert fingerprint.day == datetime(2026, 1, 2).date()
+    assert fingerprint.similarity(fingerprint) == 1.0
+    assert short.body_prefix == ""
+    assert fingerprint.similarity(short) == 0.0
+    assert not fingerprint.same_day(short)
+
+
+def test_title_blocking_keeps_group_order_and_reasons():
+    day = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    articles = [
+        _article(title="Steel prices rise", url="https://a.com/1", score=1, final_dt=day),
+        _article(title="Other story", url="https://b.com/1", final_dt=day),
+        _article(title="Steel prices rise", url="https://c.com/1", score=3, final_dt=day),
+        _article(title="Copy", url="https://a.com/1/?utm_source=x", final_dt=day),
+        _article(title="Steel prices rise", url="https://d.com/1", final_dt=datetime(2026, 1, 5, tzinfo=timezone.utc)),
+    ]
+
+    deduped, stats = deduplicate_articles(articles)
+
+    assert [a["url"] for a in deduped] == ["https://c.com/1", "https://b.com/1", "https://d.com/1"]
+    assert [(d["removed_title"], d["reason"]) for d in stats["merge_details"]] == [
+        ("Steel prices rise", "url"),
+        ("Copy", "url"),
+    ]
+
+
+def test_simhash_keeps_edited_copies_close():
+    rng = random.Random(4)
+    text = _random_words(rng)[:1200]
+    edited = text[:400] + "（鉄鋼新聞）" + text[406:]
+
+    assert simhash(text) == simhash(text)
+    assert hamming_distance(simhash(text), simhash(edited)) <= 4
+    assert hamming_distance(simhash(text), simhash(_random_words(rng)[:1200])) > 10
+    assert simhash("") == 0
+
+
+def test_simhash_index_matches_brute_force():
+    rng = random.Random(5)
+    index = SimHashIndex(max_distance=4)
+    stored = [rng.getrandbits(64) for _ in range(20000)]
+    for key, value in enumerate(stored):
+        index.add(value, key)
+    queries = [stored[i] ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for i in range(0, 20000, 500)]
+    queries += [rng.getrandbits(64) for _ in range(20)]
+
+    for query in queries:
+        expected = sorted(key for key, value in enumerate(stored) if hamming_distance(query, value) <= 4)
+        assert sorted(item for _, _, item in index.near(query)) == expected
+    assert len(index) == 20000
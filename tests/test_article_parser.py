@@ -0,0 +1,205 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.adapters import article_parser
+
+
+REFERENCE_TIME = datetime(2026, 1, 6, tzinfo=timezone.utc)
+
+
+def test_fetch_articles_keeps_input_order(monkeypatch):
+    def fake_fetch_article(url, reference_time):
+        # Later URLs finish first to make ordering bugs visible.
+        time.sleep(0.01 * (3 - int(url[-1])))
+        return f"body-{url}", None, f"excerpt-{url}", "unknown"
+
+    monkeypatch.setattr(article_parser, "fetch_article", fake_fetch_article)
+
+    results = article_parser.fetch_articles(
+        ["https://a.com/1", "https://a.com/2", "https://a.com/3"],
+        REFERENCE_TIME,
+        max_workers=3,
+    )
+
+    assert [r[0] for r in results] == ["body-https://a.com/1", "body-https://a.com/2", "body-https://a.com/3"]
+
+
+def test_fetch_articles_is_bounded_by_max_workers(monkeypatch):
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def fake_fetch_article(url, reference_time):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return "body", None, "body", "unknown"
+
+    monkeypatch.setattr(article_parser, "fetch_article", fake_fetch_article)
+
+    results = article_parser.fetch_articles([f"https://a.com/{i}" for i in range(10)], REFERENCE_TIME, max_workers=2)
+
+    assert len(results) == 10
+    assert active["peak"] <= 2
+
+
+def test_fetch_articles_empty():
+    assert article_parser.fetch_articles([], REFERENCE_TIME) == []
+
+
+def test_fetch_memo_downloads_each_canonical_url_once(monkeypatch):
+    calls = []
+
+    def fake_fetch_article(url, reference_time):
+        calls.append(url)
+        time.sleep(0.01)
+        return "body", None, "body", "meta"
+
+    monkeypatch.setattr(article_parser, "fetch_article", fake_fetch_article)
+    memo = article_parser.ArticleFetchMemo()
+
+    urls = [
+        "https://www.example.com/news/1?utm_source=google",
+        "https://example.com/news/1",
+        "https://example.com/news/1#top",
+        "https://example.com/news/2",
+    ]
+    first = article_parser.fetch_articles(urls, REFERENCE_TIME, max_workers=4, memo=memo)
+    second = article_parser.fetch_articles(urls[:1], REFERENCE_TIME, max_workers=1, memo=memo)
+
+    assert len(calls) == 2
+    assert memo.misses == 2
+    assert memo.hits == 3
+    assert all(r == ("body", None, "body", "meta") for r in first + second)
+
+
+def test_fetch_memo_caches_failed_downloads(monkeypatch):
+    calls = []
+
+    def fake_fetch_article(url, reference_time):
+        calls.append(url)
+        return article_parser.FAILED_FETCH
+
+    monkeypatch.setattr(article_parser, "fetch_article", fake_fetch_article)
+    memo = article_parser.ArticleFetchMemo()
+
+    assert memo.fetch("https://a.com/x", REFERENCE_TIME) == (None, None, None, None)
+    assert memo.fetch("https://a.com/x", REFERENCE_TIME) == (None, None, None, None)
+    assert len(calls) == 1
+
+
+class FakeStreamResponse:
+    def __init__(self, content=b"", headers=None, status_code=200, encoding="utf-8"):
+        self.content = content
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.encoding = encoding
+        self.read_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            chunk = self.content[i : i + chunk_size]
+            self.read_bytes += len(chunk)
+            yield chunk
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, timeout, headers, stream):
+        return self.response
+
+
+def _html_page(paragraph, repeat=1):
+    return ("<html><head></head><body>" + f"<p>{paragraph}</p>" * repeat + "</body></html>").encode("utf-8")
+
+
+def test_fetch_article_rejects_disallowed_content_type():
+    stats = article_parser.FetchStats()
+    response = FakeStreamResponse(b"%PDF-1.7 ...", headers={"Content-Type": "application/pdf"})
+    limits = article_parser.DownloadLimits(allowed_content_types=("text/html",))
+
+    result = article_parser.fetch_article("https://a.com/x.pdf", REFERENCE_TIME, session=FakeSession(response), limits=limits, stats=stats)
+
+    assert result == article_parser.FAILED_FETCH
+    assert response.read_bytes == 0
+    assert stats.get("rejected_content_type") == 1
+
+
+def test_fetch_article_truncates_at_byte_cap():
+    stats = article_parser.FetchStats()
+    paragraph = "Steel output rose sharply in the third quarter of the year."
+    response = FakeStreamResponse(_html_page(paragraph, repeat=5000), headers={"Content-Type": "text/html; charset=utf-8"})
+    limits = article_parser.DownloadLimits(max_bytes=200 * 1024, allowed_content_types=("text/html",))
+
+    body, _, _, _ = article_parser.fetch_article("https://a.com/big", REFERENCE_TIME, session=FakeSession(response), limits=limits, stats=stats)
+
+    assert body.startswith(paragraph)
+    assert response.read_bytes <= 256 * 1024
+    assert stats.get("truncated") == 1
+
+
+def test_fetch_article_without_content_type_is_allowed():
+    paragraph = "高炉の改修工事が完了し、来月から生産を再開する予定だと発表した。"
+    response = FakeStreamResponse(_html_page(paragraph))
+    limits = article_parser.DownloadLimits(allowed_content_types=("text/html",))
+
+    body, _, _, _ = article_parser.fetch_article("https://a.com/x", REFERENCE_TIME, session=FakeSession(response), limits=limits)
+
+    assert body == paragraph
+
+
+def _dated_page(published, paragraph="Nippon Steel said it would restart the blast furnace next month.", repeat=200):
+    head = f'<html><head><meta property="article:published_time" content="{published}"></head>'
+    return (head + "<body>" + f"<p>{paragraph}</p>" * repeat + "</body></html>").encode("utf-8")
+
+
+def _probe():
+    return article_parser.HeadProbe(
+        window_start=datetime(2024, 5, 20, 12, 0, tzinfo=timezone.utc),
+        window_end=datetime(2024, 5, 21, 12, 0, tzinfo=timezone.utc),
+        max_bytes=1024,
+    )
+
+
+def test_head_probe_stops_before_body_when_out_of_window():
+    stats = article_parser.FetchStats()
+    content = _dated_page("2024-05-10T09:00:00+09:00")
+    response = FakeStreamResponse(content, headers={"Content-Type": "text/html", "Content-Length": str(len(content))})
+
+    body, published_dt, _, source = article_parser.fetch_article(
+        "https://a.com/old", REFERENCE_TIME, session=FakeSession(response), stats=stats, probe=_probe()
+    )
+
+    assert body == ""
+    assert published_dt == datetime(2024, 5, 10, 0, 0, tzinfo=timezone.utc)
+    assert source == "meta"
+    assert response.read_bytes <= 1024
+    assert stats.get("probed") == 1
+    assert stats.get("probe_skipped") == 1
+    assert stats.get("probe_bytes_saved") == len(content) - response.read_bytes
+
+
+def test_head_probe_downloads_in_window_and_undated_pages():
+    stats = article_parser.FetchStats()
+    for content in (_dated_page("2024-05-21T08:00:00+09:00"), _html_page("Undated page about steel prices.", repeat=200)):
+        response = FakeStreamResponse(content, headers={"Content-Type": "text/html"})
+
+        body, _, _, _ = article_parser.fetch_article(
+            "https://a.com/new", REFERENCE_TIME, session=FakeSession(response), stats=stats, probe=_probe()
+        )
+
+        assert body.count("\n") == 199
+        assert response.read_bytes == len(content)
+    assert stats.get("probed") == 2
+    assert stats.get("probe_skipped") == 0
@@ -0,0 +1,34 @@
+from src.adapters.article_parser import classify_article
+from src.domain.article_text import article_text
+from src.domain.rule_engine import apply_rule_engine, build_rules
+from src.usecases.summary_select import apply_hard_exclusion
+from src.usecases.tag_articles import apply_tags
+
+
+def test_view_prefers_full_body_and_lowers_lazily():
+    view = article_text({"title": "JFE Steel", "body_full": "New EAF Plant", "body": "New EAF"})
+    excerpt_only = article_text({"title": None, "body": "Tariff"})
+
+    assert (view.title, view.body, view.excerpt) == ("jfe steel", "new eaf plant", "new eaf")
+    assert "excerpt" not in vars(excerpt_only)
+    assert (excerpt_only.title, excerpt_only.body) == ("", "tariff")
+
+
+def test_view_is_shared_until_the_text_changes():
+    article = {"title": "India steel", "body_full": "Capacity expansion plan", "body": "Capacity"}
+    view = article_text(article)
+
+    classify_article(article)
+    apply_rule_engine(article, build_rules([{"rule_type": "country", "tag_name": "インド", "keywords": "india"}]))
+    apply_hard_exclusion([article], build_rules([{"rule_type": "hard_exclusion", "tag_name": "x", "keywords": "recruit"}]))
+    apply_tags(article, rules={"countries": {"インド": ["India"]}, "sectors": {}})
+    assert article_text(article) is view
+
+    article["title"] = "China steel"
+    assert article_text(article) is not view
+    assert article_text(article).title == "china steel"
+
+
+def test_classify_uses_full_body_when_present():
+    assert classify_article({"title": "Mill", "body": "short", "body_full": "new plant capacity"}) == "BUSINESS"
+    assert classify_article({"title": "Mill", "body": "analyst note"}) == "STOCK"
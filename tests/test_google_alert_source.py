@@ -0,0 +1,115 @@
+import threading
+from datetime import datetime, timezone
+
+from src.adapters import google_alert_source
+from src.adapters.google_alert_source import FeedStateStore, poll_feeds
+
+
+class FakeFeed(dict):
+    def __init__(self, entries=(), **fields):
+        super().__init__(**fields)
+        self.entries = list(entries)
+
+
+def test_poll_feeds_persists_validators_and_replays_entries_on_304(tmp_path):
+    state_path = str(tmp_path / "feeds.json")
+    entry = {"title": "JFE to build EAF", "link": "https://a.com/1", "published": "Tue, 21 May 2024 01:00:00 GMT"}
+    calls = []
+
+    def first_parse(url, etag=None, modified=None):
+        calls.append((url, etag, modified))
+        return FakeFeed([entry], status=200, etag='"v1"', modified="Tue, 21 May 2024 01:00:00 GMT")
+
+    poll_feeds(["https://rss/a"], state=FeedStateStore(state_path), parse=first_parse)
+
+    def second_parse(url, etag=None, modified=None):
+        calls.append((url, etag, modified))
+        return FakeFeed([], status=304)
+
+    polls = poll_feeds(["https://rss/a"], state=FeedStateStore(state_path), parse=second_parse)
+
+    assert calls[0] == ("https://rss/a", None, None)
+    assert calls[1] == ("https://rss/a", '"v1"', "Tue, 21 May 2024 01:00:00 GMT")
+    assert polls["https://rss/a"].not_modified
+    assert polls["https://rss/a"].entries == [entry]
+
+
+def test_poll_feeds_runs_concurrently_and_once_per_url():
+    barrier = threading.Barrier(3, timeout=2)
+    calls = []
+
+    def parse(url, etag=None, modified=None):
+        calls.append(url)
+        barrier.wait()
+        return FakeFeed([], status=200)
+
+    polls = poll_feeds(["https://rss/a", "https://rss/b", "https://rss/a", "https://rss/c"], parse=parse)
+
+    assert sorted(calls) == ["https://rss/a", "https://rss/b", "https://rss/c"]
+    assert set(polls) == {"https://rss/a", "https://rss/b", "https://rss/c"}
+
+
+def test_fetch_google_alert_articles_uses_polled_entries(monkeypatch):
+    def fail_parse(url):
+        raise AssertionError("feed should not be fetched again")
+
+    monkeypatch.setattr(google_alert_source.feedparser, "parse", fail_parse)
+    monkeypatch.setattr(
+        google_alert_source,
+        "fetch_article",
+        lambda url, reference_time: ("body text", None, "body text", "unknown"),
+    )
+    polls = {
+        "https://rss/a": google_alert_source.FeedPoll(
+            url="https://rss/a",
+            entries=[{"title": "A", "link": "https://a.com/1", "published": "Tue, 21 May 2024 01:00:00 GMT"}],
+        )
+    }
+
+    articles = google_alert_source.fetch_google_alert_articles(
+        "JFE",
+        {"JFE": ["https://rss/a"]},
+        datetime(2024, 5, 21, 9, 0, tzinfo=timezone.utc),
+        feed_polls=polls,
+    )
+
+    assert [a["url"] for a in articles] == ["https://a.com/1"]
+
+
+def _entry(title, link, published):
+    return {"title": title, "link": link, "published": published}
+
+
+def test_entries_are_filtered_before_scraping_and_stop_at_need(monkeypatch):
+    scraped = []
+
+    def fake_fetch_article(url, reference_time):
+        scraped.append(url)
+        return ("body text", None, "body text", "unknown")
+
+    monkeypatch.setattr(google_alert_source, "fetch_article", fake_fetch_article)
+    entries = [
+        _entry("Old story", "https://a.com/old", "Mon, 13 May 2024 01:00:00 GMT"),
+        _entry("Nippon Steel raises prices!", "https://a.com/dup", "Tue, 21 May 2024 02:00:00 GMT"),
+        _entry("Older fresh story", "https://a.com/2", "Tue, 21 May 2024 01:00:00 GMT"),
+        _entry("Newest story", "https://a.com/1", "Tue, 21 May 2024 03:00:00 GMT"),
+        _entry("Third story", "https://a.com/3", "Mon, 20 May 2024 23:00:00 GMT"),
+    ]
+    polls = {"https://rss/a": google_alert_source.FeedPoll(url="https://rss/a", entries=entries)}
+    stats = {}
+
+    articles = google_alert_source.fetch_google_alert_articles(
+        "日本製鉄",
+        {"日本製鉄": ["https://rss/a"]},
+        datetime(2024, 5, 21, 9, 0, tzinfo=timezone.utc),
+        window_start=datetime(2024, 5, 20, 9, 0, tzinfo=timezone.utc),
+        window_end=datetime(2024, 5, 21, 9, 0, tzinfo=timezone.utc),
+        feed_polls=polls,
+        serper_articles=[{"title": "Nippon Steel raises prices"}],
+        need=2,
+        stats=stats,
+    )
+
+    assert scraped == ["https://a.com/1", "https://a.com/2"]
+    assert [a["url"] for a in articles] == ["https://a.com/1", "https://a.com/2"]
+    assert stats == {"skipped_feed_date": 1, "skipped_title": 1, "scraped": 2}
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from src.adapters.host_scheduler import HostScheduler, host_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_host_key_ignores_www_and_case():
+    assert host_key("https://WWW.Reuters.com/markets/x") == "reuters.com"
+
+
+def test_same_host_requests_are_spaced():
+    clock = FakeClock()
+    scheduler = HostScheduler(max_per_host=2, min_interval=1.5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        with scheduler.slot("https://reuters.com/a"):
+            pass
+
+    assert clock.sleeps == [1.5, 1.5]
+    stats = scheduler.wait_stats()["reuters.com"]
+    assert stats["requests"] == 3
+    assert stats["total_wait"] == 3.0
+    assert stats["max_wait"] == 1.5
+
+
+def test_different_hosts_do_not_wait():
+    clock = FakeClock()
+    scheduler = HostScheduler(max_per_host=1, min_interval=5, clock=clock, sleep=clock.sleep)
+
+    with scheduler.slot("https://reuters.com/a"):
+        pass
+    with scheduler.slot("https://nikkei.com/a"):
+        pass
+
+    assert clock.sleeps == []
+
+
+def test_per_host_concurrency_is_bounded():
+    scheduler = HostScheduler(max_per_host=2, min_interval=0)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def work():
+        with scheduler.slot("https://nikkei.com/x"):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert active["peak"] == 2
@@ -0,0 +1,71 @@
+from src.adapters import article_parser, html_encoding
+from src.adapters.html_encoding import detect_html_encoding
+
+JAPANESE = "普通鋼電炉各社は５月契約の異形棒鋼価格を前月比横ばいで据え置く方針を固めた。"
+# Windows-31J extensions that plain shift_jis cannot decode.
+CP932_ONLY = "東京製鉄㈱は①全品種の価格を据え置くと発表した。"
+
+
+def _page(head, encoding, text=JAPANESE):
+    return f"<html><head>{head}</head><body><p>{text}</p></body></html>".encode(encoding)
+
+
+def test_header_charset_wins_over_meta():
+    content = _page('<meta charset="euc-jp">', "utf-8")
+
+    assert detect_html_encoding(content, "text/html; charset=UTF-8") == "utf-8"
+
+
+def test_meta_charset_used_when_header_has_none():
+    content = _page('<meta charset="Shift_JIS">', "cp932", text=CP932_ONLY)
+
+    assert detect_html_encoding(content, "text/html") == "cp932"
+    assert CP932_ONLY in content.decode(detect_html_encoding(content, "text/html"))
+
+
+def test_http_equiv_declaration():
+    content = _page('<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=EUC-JP">', "euc-jp")
+
+    assert detect_html_encoding(content) == "euc-jp"
+
+
+def test_bom_and_unknown_labels():
+    assert detect_html_encoding(b"\xef\xbb\xbf<html></html>") == "utf-8-sig"
+    assert html_encoding.charset_from_content_type("text/html; charset=x-unknown") is None
+
+
+def test_detection_only_reads_a_bounded_prefix(monkeypatch):
+    seen = []
+
+    def fake_detect(data):
+        seen.append(len(data))
+        return {"encoding": "EUC-JP"}
+
+    monkeypatch.setattr(html_encoding.requests.compat.chardet, "detect", fake_detect)
+    content = _page("", "euc-jp") * 10000
+
+    assert detect_html_encoding(content, "text/html") == "euc-jp"
+    assert seen == [html_encoding.DETECTION_BYTES]
+
+
+def test_fetch_article_decodes_shift_jis_page_without_header_charset():
+    class FakeResponse:
+        status_code = 200
+        headers = {"Content-Type": "text/html"}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def iter_content(self, chunk_size=1):
+            yield _page('<meta http-equiv="content-type" content="text/html; charset=shift_jis">', "cp932")
+
+    class FakeSession:
+        def get(self, url, timeout, headers, stream):
+            return FakeResponse()
+
+    body, _, _, _ = article_parser.fetch_article("https://a.com/x", None, session=FakeSession())
+
+    assert body == JAPANESE
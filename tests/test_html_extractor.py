@@ -0,0 +1,43 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.adapters.article_parser import parse_article_html
+from src.adapters.html_extractor import extract_page
+from src.domain.time_utils import JST
+from tests import legacy_article_parser
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures" / "html").glob("*.html"))
+REFERENCE_TIME = datetime(2024, 5, 21, 12, 0, tzinfo=JST)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_parse_article_html_matches_beautifulsoup(path):
+    html = path.read_text(encoding="utf-8")
+
+    assert parse_article_html(html, REFERENCE_TIME) == legacy_article_parser.parse_article_html(
+        html, REFERENCE_TIME
+    )
+
+
+def test_extract_page_skips_script_and_style_text():
+    page = extract_page(
+        "<style>p{}</style><script>var s='<p>x</p>';</script>"
+        "<p>a<script>b</script>c<br>d</p><p/>"
+        '<script type="application/ld+json">{"datePublished": "2024-05-20"}</script>'
+    )
+
+    assert page.paragraphs == ["acd", ""]
+    assert page.jsonld == ['{"datePublished": "2024-05-20"}']
+
+
+def test_extract_page_collects_meta_and_unclosed_paragraphs():
+    page = extract_page(
+        '<META NAME="DC.date" CONTENT="2024/05/19"><meta property="og:title">'
+        "<P>first &amp; <b>bold</b><P>second&#x3000;"
+    )
+
+    assert page.meta == [("dc.date", "2024/05/19"), ("og:title", None)]
+    # html.parser never auto-closes <p>, so the second paragraph nests inside the first.
+    assert page.paragraphs == ["first & boldsecond　", "second　"]
@@ -0,0 +1,95 @@
+import os
+import time
+
+from src.adapters import article_parser
+from src.adapters.http_cache import HttpPageCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None, encoding="utf-8"):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = encoding
+        self.apparent_encoding = "utf-8"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+
+def _store(cache, url, **kwargs):
+    response = FakeResponse(**kwargs)
+    cache.store(url, response, response.content, response.encoding)
+
+
+def test_store_and_lookup_roundtrip(tmp_path):
+    cache = HttpPageCache(str(tmp_path))
+    _store(cache, "https://a.com/1", content="鉄鋼".encode("utf-8"), headers={"ETag": '"v1"'})
+
+    page = cache.lookup("https://a.com/1")
+
+    assert page.text() == "鉄鋼"
+    assert page.validator_headers() == {"If-None-Match": '"v1"'}
+
+
+def test_responses_without_validators_are_not_stored(tmp_path):
+    cache = HttpPageCache(str(tmp_path))
+    _store(cache, "https://a.com/1", content=b"x")
+
+    assert cache.lookup("https://a.com/1") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = HttpPageCache(str(tmp_path), ttl_seconds=0)
+    _store(cache, "https://a.com/1", content=b"x", headers={"Last-Modified": "Mon, 05 Jan 2026 00:00:00 GMT"})
+    time.sleep(0.01)
+
+    assert cache.lookup("https://a.com/1") is None
+    assert cache.stats["expired"] == 1
+    assert not os.listdir(tmp_path)
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = HttpPageCache(str(tmp_path), max_bytes=25)
+    _store(cache, "https://a.com/1", content=b"a" * 10, headers={"ETag": "1"})
+    time.sleep(0.02)
+    _store(cache, "https://a.com/2", content=b"b" * 10, headers={"ETag": "2"})
+    time.sleep(0.02)
+    assert cache.lookup("https://a.com/1") is not None
+    time.sleep(0.02)
+    _store(cache, "https://a.com/3", content=b"c" * 10, headers={"ETag": "3"})
+
+    assert cache.lookup("https://a.com/1") is not None
+    assert cache.lookup("https://a.com/2") is None
+    assert cache.lookup("https://a.com/3") is not None
+    assert cache.stats["evicted"] == 1
+
+
+def test_fetch_article_serves_304_from_disk(tmp_path):
+    cache = HttpPageCache(str(tmp_path))
+    html = "<html><body><p>" + "高炉の改修工事が完了し、生産を再開した。" * 3 + "</p></body></html>"
+    sent_headers = []
+    responses = [
+        FakeResponse(content=html.encode("utf-8"), headers={"ETag": '"v1"'}),
+        FakeResponse(status_code=304, content=b"", headers={"ETag": '"v1"'}),
+    ]
+
+    class FakeSession:
+        def get(self, url, timeout, headers, stream):
+            sent_headers.append(headers)
+            return responses.pop(0)
+
+    first = article_parser.fetch_article("https://a.com/1", None, cache=cache, session=FakeSession())
+    second = article_parser.fetch_article("https://a.com/1", None, cache=cache, session=FakeSession())
+
+    assert first[0] and first[0] == second[0]
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert cache.stats["revalidated"] == 1
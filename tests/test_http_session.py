@@ -0,0 +1,41 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.adapters import http_session
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_reuses_keep_alive_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = http_session.build_session(pool_connections=1, pool_maxsize=1)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        for _ in range(3):
+            assert session.get(url, timeout=5).text == "ok"
+        stats = session.get_adapter(url).counter.snapshot()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert stats == {"requests": 3, "new_connections": 1, "reused_connections": 2}
+
+
+def test_get_session_returns_shared_instance_per_name():
+    assert http_session.get_session("serper") is http_session.get_session("serper")
+    assert http_session.get_session("serper") is not http_session.get_session("notion")
+    assert "serper" in http_session.connection_stats()
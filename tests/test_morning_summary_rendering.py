@@ -123,7 +123,7 @@ def test_call_openai_responses_raises_on_incomplete(monkeypatch):
             "usage": {"total_tokens": 100},
         })
 
-    monkeypatch.setattr(openai_summarizer.requests, "post", fake_post)
+    monkeypatch.setattr(openai_summarizer.get_session("openai"), "post", fake_post)
 
     with pytest.raises(RuntimeError):
         openai_summarizer._call_openai_responses(input_text="x", max_output_tokens=100)
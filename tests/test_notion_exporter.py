@@ -0,0 +1,83 @@
+import json
+
+import pytest
+import requests
+
+from src.adapters.notion_exporter import NotionExporter
+
+
+class FakeResponse:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeClient:
+    def __init__(self, update_error=None):
+        self.update_error = update_error
+        self.updated = []
+        self.created = []
+
+    def update_page(self, page_id, payload):
+        if page_id == "known" and self.update_error is not None:
+            raise self.update_error
+        self.updated.append(page_id)
+        return {"id": page_id}
+
+    def query_database(self, database_id, payload):
+        return {"results": []}
+
+    def create_page(self, payload):
+        self.created.append(payload)
+        return {"id": "created"}
+
+
+ARTICLE = {"title": "Steel output rises", "url": "https://example.com/steel", "body": "Crude steel output rose."}
+
+
+def make_exporter(client, tmp_path):
+    return NotionExporter(client, "articles-db", "daily-db", "run-1", audit_log_path=str(tmp_path / "audit.jsonl"))
+
+
+def read_steps(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line)["step"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_known_page_is_updated_without_lookup(tmp_path):
+    client = FakeClient()
+
+    page_id = make_exporter(client, tmp_path).upsert_article(ARTICLE, known_page_id="known")
+
+    assert page_id == "known"
+    assert client.updated == ["known"] and client.created == []
+    assert read_steps(tmp_path) == []
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        FakeResponse(404, '{"code": "object_not_found"}'),
+        FakeResponse(400, "Can't edit block that is archived. You must unarchive the block before editing."),
+    ],
+)
+def test_deleted_or_archived_known_page_falls_back_and_is_logged(tmp_path, response):
+    client = FakeClient(update_error=requests.HTTPError("gone", response=response))
+
+    page_id = make_exporter(client, tmp_path).upsert_article(ARTICLE, known_page_id="known")
+
+    assert page_id == "created"
+    assert len(client.created) == 1
+    assert read_steps(tmp_path) == ["update_known_page_failed"]
+
+
+def test_other_known_page_errors_are_not_swallowed(tmp_path):
+    client = FakeClient(update_error=requests.HTTPError("rate limited", response=FakeResponse(429)))
+
+    with pytest.raises(requests.HTTPError):
+        make_exporter(client, tmp_path).upsert_article(ARTICLE, known_page_id="known")
+
+    assert client.created == []
+    assert read_steps(tmp_path) == ["upsert_article_failed"]
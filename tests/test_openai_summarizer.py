@@ -23,7 +23,7 @@ def test_gpt5_model_uses_responses_endpoint(monkeypatch):
         called["url"] = url
         return DummyResponse({"output_text": "ok", "usage": {"total_tokens": 10}})
 
-    monkeypatch.setattr(openai_summarizer.requests, "post", fake_post)
+    monkeypatch.setattr(openai_summarizer.get_session("openai"), "post", fake_post)
 
     out = openai_summarizer._call_openai(
         model="gpt-5.4-mini",
@@ -45,7 +45,7 @@ def test_non_gpt5_model_uses_chat_completions_endpoint(monkeypatch):
         called["url"] = url
         return DummyResponse({"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 10}})
 
-    monkeypatch.setattr(openai_summarizer.requests, "post", fake_post)
+    monkeypatch.setattr(openai_summarizer.get_session("openai"), "post", fake_post)
 
     out = openai_summarizer._call_openai(
         model="gpt-4o-mini",
@@ -100,7 +100,7 @@ def test_responses_api_extracts_output_text(monkeypatch):
     def fake_post(url, headers, json, timeout):
         return DummyResponse({"output_text": "from_output_text", "usage": {"total_tokens": 10}})
 
-    monkeypatch.setattr(openai_summarizer.requests, "post", fake_post)
+    monkeypatch.setattr(openai_summarizer.get_session("openai"), "post", fake_post)
 
     out = openai_summarizer._call_openai_responses(input_text="x")
 
@@ -120,7 +120,7 @@ def test_responses_api_extracts_output_content_output_text(monkeypatch):
             }
         )
 
-    monkeypatch.setattr(openai_summarizer.requests, "post", fake_post)
+    monkeypatch.setattr(openai_summarizer.get_session("openai"), "post", fake_post)
 
     out = openai_summarizer._call_openai_responses(input_text="x")
 
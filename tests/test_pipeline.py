@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from src.usecases.pipeline import run_pipeline
+
+
+def test_stages_keep_input_order():
+    seen = []
+
+    stats = run_pipeline(
+        [1, 2, 3, 4],
+        [("double", lambda x: x * 2), ("collect", seen.append)],
+        queue_size=1,
+    )
+
+    assert seen == [2, 4, 6, 8]
+    assert [(s.name, s.items) for s in stats] == [("double", 4), ("collect", 4)]
+
+
+def test_later_stage_overlaps_next_item_of_earlier_stage():
+    second_started = threading.Event()
+    overlapped = []
+
+    def fetch(item):
+        if item == 2:
+            # Item 1 is being summarised while item 2 is fetched.
+            overlapped.append(second_started.wait(timeout=2))
+        return item
+
+    def summarize(item):
+        if item == 1:
+            second_started.set()
+        return item
+
+    run_pipeline([1, 2], [("fetch", fetch), ("summarize", summarize)])
+
+    assert overlapped == [True]
+
+
+def test_first_error_stops_pipeline_and_is_raised():
+    fetched = []
+    processed = []
+
+    def fetch(item):
+        fetched.append(item)
+        return item
+
+    def export(item):
+        if item == 2:
+            raise RuntimeError("notion down")
+        processed.append(item)
+        return item
+
+    with pytest.raises(RuntimeError, match="notion down"):
+        run_pipeline(range(100), [("fetch", fetch), ("export", export), ("summarize", lambda x: x)])
+
+    assert processed == [0, 1]
+    # The source stage stops pulling items once a later stage has failed.
+    assert len(fetched) < 10
@@ -0,0 +1,144 @@
+import logging
+import random
+
+from src.domain.rule_engine import (
+    KeywordAutomaton,
+    Rule,
+    RuleSet,
+    _match_rule,
+    apply_rule_engine,
+    build_rules,
+    compile_rules,
+    evaluate_article,
+)
+from src.usecases.score_articles import apply_scores
+from src.usecases.summary_select import apply_hard_exclusion
+from src.usecases.tag_articles import apply_tags
+
+
+def test_automaton_reports_overlapping_and_nested_keywords():
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "鉄鋼", "鋼"])
+
+    hits = sorted((start, automaton.keywords[keyword_id]) for start, keyword_id in automaton.scan("ushers 鉄鋼"))
+
+    assert hits == [(1, "she"), (2, "he"), (2, "hers"), (7, "鉄鋼"), (8, "鋼")]
+    assert automaton.scan("") == []
+
+
+def test_ruleset_respects_match_field_and_negative_keywords():
+    rules = RuleSet([
+        Rule("importance", "title", ("steel",), (), "title", 1.0, 0.0),
+        Rule("importance", "body", ("steel",), (), "body", 1.0, 0.0),
+        Rule("importance", "span", ("prices steel",), (), "both", 1.0, 0.0),
+        Rule("importance", "negated", ("output",), ("forecast",), "both", 1.0, 0.0),
+        Rule("importance", "negated-in-title-only", ("output",), ("forecast",), "body", 1.0, 0.0),
+    ])
+
+    matched = rules.matching_rules("forecast: prices", "steel output")
+
+    # "prices steel" only exists across the title/body join, like f"{title} {body}".
+    assert [rule.tag_name for rule in matched] == ["body", "span", "negated-in-title-only"]
+
+
+def test_ruleset_matches_per_rule_evaluation():
+    rng = random.Random(0)
+    for _ in range(200):
+        alphabet = rng.choice(["ab c", "鉄鋼 価格"])
+
+        def text(lo, hi):
+            return "".join(rng.choice(alphabet) for _ in range(rng.randrange(lo, hi)))
+
+        rules = [
+            Rule(
+                rng.choice(["country", "sector", "importance"]),
+                rng.choice(["", "A", "B", "C"]),
+                tuple(text(1, 4) for _ in range(rng.randrange(0, 4))),
+                tuple(text(1, 4) for _ in range(rng.randrange(0, 3))),
+                rng.choice(["both", "title", "body"]),
+                float(rng.randrange(-2, 3)),
+                float(rng.randrange(3)),
+            )
+            for _ in range(rng.randrange(1, 20))
+        ]
+        ruleset = RuleSet(rules)
+        title, body = text(0, 12), text(0, 40)
+
+        assert ruleset.matching_rules(title, body) == [rule for rule in rules if _match_rule(rule, title, body)]
+
+
+def test_build_rules_returns_compiled_ruleset():
+    rules = build_rules([
+        {"rule_type": "Country", "tag_name": "日本", "keywords": "日本製鉄, JFE", "match_field": "both", "priority": 1},
+        {"rule_type": "importance", "tag_name": "投資", "keywords": "投資", "negative_keywords": "株価", "weight": 3},
+    ])
+
+    result = apply_rule_engine({"title": "JFE、設備投資", "body": "電炉を新設"}, rules)
+
+    assert isinstance(rules, RuleSet)
+    assert [rule.rule_type for rule in rules] == ["country", "importance"]
+    assert result["country_tags"] == ["日本"]
+    assert result["primary_country"] == "日本"
+    assert result["importance_score"] == 3.0
+    assert result["importance_reasons"] == ["投資(+3)"]
+
+
+def test_compile_rules_reuses_ruleset_for_equal_rule_rows(caplog):
+    raw = [{"rule_type": "sector", "tag_name": "電炉", "keywords": "電炉, eaf", "weight": None, "notes": "cache-test"}]
+
+    with caplog.at_level(logging.INFO, logger="src.domain.rule_engine"):
+        first = compile_rules(raw)
+        second = compile_rules([dict(row) for row in raw])
+        changed = compile_rules([dict(raw[0], keywords="電炉")])
+
+    assert first is second
+    assert changed is not first
+    assert [record.getMessage().startswith("Rules compiled:") for record in caplog.records] == [True, True]
+    assert "rules=1 by_type={'sector': 1} keywords=2" in caplog.records[0].getMessage()
+
+
+def test_apply_tags_uses_precompiled_rules():
+    engine_rules = build_rules([{"rule_type": "country", "tag_name": "インド", "keywords": "india", "priority": 1}])
+    article = {"title": "India steel output", "body": ""}
+
+    apply_tags(article, rules={"countries": {}, "sectors": {}}, engine_rules=engine_rules)
+
+    assert article["country_tags"] == ["インド"]
+    assert article["primary_country"] == "インド"
+
+
+def test_evaluate_article_covers_every_rule_type_in_one_scan(monkeypatch):
+    rules = build_rules([
+        {"rule_type": "country", "tag_name": "中国", "keywords": "china", "priority": 2},
+        {"rule_type": "country", "tag_name": "日本", "keywords": "jfe", "priority": 1},
+        {"rule_type": "sector", "tag_name": "電炉", "keywords": "eaf"},
+        {"rule_type": "importance", "tag_name": "減産", "keywords": "cut", "weight": 2},
+        {"rule_type": "hard_exclusion", "tag_name": "求人", "keywords": "recruit"},
+        {"rule_type": "exclude", "tag_name": "", "keywords": "eaf", "match_field": "title"},
+    ])
+    scans = []
+    original = RuleSet.matching_rules
+    monkeypatch.setattr(RuleSet, "matching_rules", lambda self, *args: scans.append(args) or original(self, *args))
+    article = {"title": "China EAF output cut", "body_full": "JFE recruit notice"}
+
+    apply_scores([article], notion_rules=None, engine_rules=rules)
+    kept, excluded = apply_hard_exclusion([article], rules)
+    apply_tags(article, engine_rules=rules)
+    evaluation = evaluate_article(article, rules)
+
+    assert len(scans) == 1
+    assert article["score"] == 2.0
+    assert article["importance_reasons"] == "減産(+2)"
+    assert (article["country_tags"], article["sector_tags"], article["primary_country"]) == (["中国", "日本"], ["電炉"], "中国")
+    assert kept == []
+    assert excluded[0]["hard_exclusion_reasons"] == ["求人(hard_exclusion)", "(exclude)"]
+    assert evaluation.hard_exclusion_reasons == ("求人(hard_exclusion)", "(exclude)")
+
+
+def test_evaluation_is_recomputed_when_article_text_changes():
+    rules = build_rules([{"rule_type": "importance", "tag_name": "投資", "keywords": "投資", "weight": 1}])
+    article = {"title": "設備投資", "body": ""}
+    assert evaluate_article(article, rules).importance_score == 1.0
+
+    article["title"] = "決算"
+
+    assert evaluate_article(article, rules).importance_score == 0.0
@@ -0,0 +1,46 @@
+from datetime import date, datetime, timezone
+
+from src.adapters.seen_store import SeenArticleStore
+from src.domain.notion_utils import compute_article_id
+
+PUBLISHED = datetime(2024, 5, 20, 6, 0, tzinfo=timezone.utc)
+
+
+def test_first_seen_date_survives_later_runs(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    article_id = compute_article_id("https://www.example.com/news/1?utm_source=x")
+    store = SeenArticleStore(path)
+    store.remember(article_id, date(2024, 5, 20), PUBLISHED, "hash-1")
+    store.set_page_id(article_id, "page-1")
+    store.close(date(2024, 5, 20))
+
+    store = SeenArticleStore(path)
+    store.remember(article_id, date(2024, 5, 21))
+    seen = store.lookup(compute_article_id("https://example.com/news/1"))
+
+    assert seen.first_seen == "2024-05-20"
+    assert seen.last_seen == "2024-05-21"
+    assert seen.published_at == PUBLISHED
+    assert seen.body_hash == "hash-1"
+    assert seen.page_id == "page-1"
+    assert store.lookup(compute_article_id("https://example.com/news/2")) is None
+    assert store.lookup("") is None
+
+
+def test_close_prunes_rows_past_retention(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    store = SeenArticleStore(path, retention_days=7)
+    store.remember("old", date(2024, 5, 1), PUBLISHED)
+    store.remember("recent", date(2024, 5, 15), PUBLISHED)
+    store.close(date(2024, 5, 21))
+
+    store = SeenArticleStore(path, retention_days=7)
+    assert store.lookup("old") is None
+    assert store.lookup("recent").first_seen == "2024-05-15"
+
+
+def test_from_settings_is_opt_in(tmp_path):
+    assert SeenArticleStore.from_settings({}) is None
+    store = SeenArticleStore.from_settings({"seen_store": {"enabled": True, "path": str(tmp_path / "a" / "seen.sqlite3")}})
+    assert store.retention_days == 30
+    assert (tmp_path / "a" / "seen.sqlite3").exists()
@@ -0,0 +1,64 @@
+import time
+from datetime import datetime
+
+from src.adapters import serper_source
+from src.adapters.serper_cache import SerperResultCache
+from src.domain.time_utils import JST
+
+WINDOW_START = datetime(2024, 5, 20, 8, 15, tzinfo=JST)
+
+
+class FakeSession:
+    def __init__(self):
+        self.bodies = []
+
+    def post(self, url, headers, json, timeout):
+        self.bodies.append(json)
+
+        class Response:
+            status_code = 200
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return [{"news": [{"title": f"{item['q']} news"}]} for item in json]
+
+        return Response()
+
+
+def test_rerun_is_served_from_cache(tmp_path):
+    cache = SerperResultCache(str(tmp_path))
+    first = FakeSession()
+    serper_source.search_serper_batch(["日本製鉄", "JFE"], session=first, cache=cache, window_start=WINDOW_START)
+
+    rerun = FakeSession()
+    later_start = WINDOW_START.replace(hour=9, minute=40)
+    results = serper_source.search_serper_batch(["日本製鉄", "JFE"], session=rerun, cache=cache, window_start=later_start)
+
+    assert rerun.bodies == []
+    assert results["日本製鉄"] == [{"title": "日本製鉄 news"}]
+    assert cache.stats == {"hits": 2, "misses": 2, "stored": 2, "expired": 0}
+
+
+def test_refresh_and_expiry_bypass_cache(tmp_path):
+    SerperResultCache(str(tmp_path)).put(serper_source._query_payload("JFE"), WINDOW_START, [{"title": "old"}])
+
+    refreshing = SerperResultCache(str(tmp_path), refresh=True)
+    session = FakeSession()
+    results = serper_source.search_serper_batch(["JFE"], session=session, cache=refreshing, window_start=WINDOW_START)
+    assert results["JFE"] == [{"title": "JFE news"}]
+    assert len(session.bodies) == 1
+
+    expiring = SerperResultCache(str(tmp_path), ttl_seconds=0)
+    time.sleep(0.01)
+    assert expiring.get(serper_source._query_payload("JFE"), WINDOW_START) is None
+    assert expiring.stats["expired"] == 1
+
+
+def test_other_window_day_misses(tmp_path):
+    cache = SerperResultCache(str(tmp_path))
+    cache.put(serper_source._query_payload("JFE"), WINDOW_START, [])
+
+    assert cache.get(serper_source._query_payload("JFE"), WINDOW_START.replace(day=21)) is None
+    assert cache.get(serper_source._query_payload("JFE"), WINDOW_START) == []
@@ -0,0 +1,81 @@
+from src.adapters import serper_source
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise serper_source.requests.HTTPError(str(self.status_code))
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, status_codes=None):
+        self.bodies = []
+        self.status_codes = list(status_codes or [])
+
+    def post(self, url, headers, json, timeout):
+        self.bodies.append(json)
+        status = self.status_codes.pop(0) if self.status_codes else 200
+        return FakeResponse(status, [{"news": [{"title": f"{item['q']} news"}]} for item in json])
+
+
+def test_batch_deduplicates_queries_and_fans_out_results():
+    session = FakeSession()
+
+    results = serper_source.search_serper_batch(["日本製鉄", "JFE", "日本製鉄", "電炉"], session=session)
+
+    assert len(session.bodies) == 1
+    assert [item["q"] for item in session.bodies[0]] == ["日本製鉄", "JFE", "電炉"]
+    assert results["JFE"] == [{"title": "JFE news"}]
+    assert set(results) == {"日本製鉄", "JFE", "電炉"}
+
+
+def test_batch_splits_requests_and_keeps_credit_error_per_batch():
+    session = FakeSession(status_codes=[200, 402])
+
+    results = serper_source.search_serper_batch(["a", "b", "c"], session=session, batch_size=2)
+
+    assert [len(body) for body in session.bodies] == [2, 1]
+    assert results["a"] == [{"title": "a news"}]
+    assert results["c"] == "SERPER_CREDIT_ERROR"
+
+
+class TimeoutBatchSession(FakeSession):
+    def post(self, url, headers, json, timeout):
+        self.bodies.append(json)
+        if isinstance(json, list):
+            raise serper_source.requests.Timeout("batch timed out")
+        return FakeResponse(200, {"news": [{"title": f"{json['q']} news"}]})
+
+
+def test_batch_failure_retries_then_falls_back_to_single_queries():
+    session = TimeoutBatchSession()
+
+    results = serper_source.search_serper_batch(["a", "b"], session=session, num=20, page=2)
+
+    assert [isinstance(body, list) for body in session.bodies] == [True, True, False, False]
+    assert session.bodies[2] == {"q": "a", "num": 20, "timeRange": "d1", "hl": "en", "page": 2}
+    assert results == {"a": [{"title": "a news"}], "b": [{"title": "b news"}]}
+
+
+def test_paging_defaults_to_single_deep_request():
+    assert serper_source.SerperPaging.from_settings({}) == serper_source.SerperPaging(num=500, max_pages=1, target=0)
+
+    adaptive = serper_source.SerperPaging.from_settings(
+        {"serper": {"adaptive": True, "page_size": 20, "max_pages": 3}, "limits": {"max_articles_per_label": 4}}
+    )
+    assert adaptive == serper_source.SerperPaging(num=20, max_pages=3, target=4)
+
+
+def test_batch_requests_later_pages():
+    session = FakeSession()
+
+    serper_source.search_serper_batch(["a"], session=session, num=20, page=2)
+
+    assert session.bodies == [[{"q": "a", "num": 20, "timeRange": "d1", "hl": "en", "page": 2}]]
@@ -0,0 +1,55 @@
+import random
+from datetime import date
+
+from src.adapters.story_index import RecentStoryIndex
+
+
+def _body(rng):
+    words = [f"{a}{b}" for a in "鉄鋼炉価需輸電要" for b in "上下増減新旧大小"]
+    return " ".join(f"{rng.choice(words)}{rng.randrange(100)}" for _ in range(260))
+
+
+def _article(title, body, url=""):
+    return {"title": title, "url": url, "body_full": body}
+
+
+def test_repost_on_a_later_day_is_flagged(tmp_path):
+    path = str(tmp_path / "stories.sqlite3")
+    rng = random.Random(1)
+    story = _body(rng)
+    index = RecentStoryIndex(path, date(2024, 5, 20))
+    index.record([_article("Reuters original", story, "https://reuters.com/a")], label="日本製鉄")
+    index.close()
+
+    index = RecentStoryIndex(path, date(2024, 5, 21))
+    repost = _article("地方紙転載", story[:600] + "（共同）" + story[604:], "https://local.example/b")
+    other = _article("new story", _body(rng))
+    short = _article("short", "短い本文")
+    fresh, repeated = index.split_reported([repost, other, short])
+
+    assert len(index) == 1
+    assert fresh == [other, short]
+    assert repeated == [repost]
+    assert repost["reported_before"] == {"reported_on": "2024-05-20", "title": "Reuters original", "url": "https://reuters.com/a"}
+
+
+def test_same_day_and_expired_reports_are_ignored(tmp_path):
+    path = str(tmp_path / "stories.sqlite3")
+    rng = random.Random(2)
+    old_story, today_story = _body(rng), _body(rng)
+    index = RecentStoryIndex(path, date(2024, 5, 1))
+    index.record([_article("old", old_story)])
+    index.close()
+    index = RecentStoryIndex(path, date(2024, 5, 21), days=7)
+    index.record([_article("today", today_story)])
+
+    assert len(index) == 1
+    assert index.find_reported(_article("old again", old_story)) is None
+    assert index.find_reported(_article("rerun", today_story)) is None
+
+
+def test_from_settings_is_opt_in(tmp_path):
+    assert RecentStoryIndex.from_settings({}, date(2024, 5, 21)) is None
+    conf = {"story_index": {"enabled": True, "path": str(tmp_path / "s.sqlite3"), "days": 3, "max_distance": 2}}
+    index = RecentStoryIndex.from_settings(conf, date(2024, 5, 21))
+    assert index.days == 3
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from src.domain.rule_engine import Rule
 from src.usecases.summary_select import (
     apply_hard_exclusion,
+    count_summary_candidates,
     select_summary_articles,
     sort_for_summary,
 )
@@ -48,3 +49,21 @@ def test_excludes_types_when_requested():
     ]
     selected = select_summary_articles(articles, exclude_types=["stock"])
     assert [article["title"] for article in selected] == ["Business item"]
+
+
+def test_count_summary_candidates_ignores_duplicates_outside_window_and_excluded():
+    now = datetime(2024, 5, 21, 12, 0, tzinfo=timezone.utc)
+    rules = [
+        Rule("hard_exclusion", "求人", ("recruit",), tuple(), "both", 0.0, 0.0),
+    ]
+    articles = [
+        {"title": "steel market", "body": "x", "url": "https://a.com/1?utm_source=x", "final_dt": now},
+        {"title": "steel market", "body": "x", "url": "https://a.com/1", "final_dt": now},
+        {"title": "steel recruit info", "body": "x", "url": "https://a.com/2", "final_dt": now},
+        {"title": "old story", "body": "x", "url": "https://a.com/3", "final_dt": now.replace(day=1)},
+        {"title": "steel prices", "body": "x", "url": "https://a.com/4", "final_dt": now},
+    ]
+
+    count = count_summary_candidates(articles, now.replace(hour=0), now, rules)
+
+    assert count == 2
@@ -1,3 +1,4 @@
+from src.adapters.google_alert_source import FeedPoll
 from src.usecases.target_coverage import build_processing_labels, summarize_target_coverage
 
 
@@ -30,3 +31,20 @@ def test_summarize_target_coverage_counts_only_types():
         "rss_only": 1,
         "serper_only": 1,
     }
+
+
+def test_summarize_target_coverage_reports_feed_polls():
+    google_alert_rss = {"rss-only": ["https://example.com/a", "https://example.com/b"]}
+    feed_polls = {
+        "https://example.com/a": FeedPoll(url="https://example.com/a", status=304, elapsed=0.2, not_modified=True),
+        "https://example.com/b": FeedPoll(url="https://example.com/b", status=200, elapsed=0.6),
+    }
+
+    stats = summarize_target_coverage(["rss-only"], {}, google_alert_rss, feed_polls=feed_polls)
+
+    assert stats["rss_polled"] == 2
+    assert stats["rss_not_modified"] == 1
+    assert stats["rss_not_modified_rate"] == 0.5
+    assert stats["rss_poll_errors"] == 0
+    assert abs(stats["rss_poll_avg_seconds"] - 0.4) < 1e-9
+    assert stats["rss_poll_max_seconds"] == 0.6
@@ -1,6 +1,12 @@
 from datetime import datetime, timedelta, timezone
 
-from src.domain.time_utils import JST, compute_lookback_window, parse_publish_datetime, parse_publish_datetime_from_url
+from src.domain.time_utils import (
+    JST,
+    compute_lookback_window,
+    is_clearly_outside_window,
+    parse_publish_datetime,
+    parse_publish_datetime_from_url,
+)
 
 
 def test_compute_lookback_window_on_monday_weekend_mode():
@@ -58,3 +64,15 @@ def test_parse_publish_datetime_japanese_relative_dates():
     assert parse_publish_datetime("3時間前", ref) == datetime(2026, 4, 29, 9, 0, tzinfo=timezone.utc)
     assert parse_publish_datetime("2日前", ref) == datetime(2026, 4, 27, 12, 0, tzinfo=timezone.utc)
     assert parse_publish_datetime("1週前", ref) == datetime(2026, 4, 22, 12, 0, tzinfo=timezone.utc)
+
+
+def test_is_clearly_outside_window_respects_tolerance():
+    start = datetime(2026, 1, 5, 6, 49, tzinfo=JST)
+    end = datetime(2026, 1, 6, 6, 49, tzinfo=JST)
+    tolerance = timedelta(hours=12)
+
+    assert is_clearly_outside_window(start - timedelta(hours=13), start, end, tolerance)
+    assert not is_clearly_outside_window(start - timedelta(hours=11), start, end, tolerance)
+    assert not is_clearly_outside_window(end + timedelta(hours=11), start, end, tolerance)
+    assert is_clearly_outside_window(end + timedelta(hours=13), start, end, tolerance)
+    assert not is_clearly_outside_window(None, start, end, tolerance)